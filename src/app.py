@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
-import sys
+import gc
 from svg_config import _env_file_path  # noqa: F401 # Triggers environment configuration
 
 from log import config_console_logger   # noqa: E402
-from app import create_app              # noqa: E402
+from app import create_app, prewarm_templates  # noqa: E402
+from app.config import settings  # noqa: E402
 
 config_console_logger()
 
 app = create_app()
+prewarm_templates(app)
 
-if __name__ == "__main__":
-    debug = "debug" in sys.argv
-    app.run(debug=debug)
+if settings.tune_gc:
+    # Move everything imported so far into the permanent generation: the collector
+    # stops rescanning it, and forked workers keep sharing those pages copy-on-write.
+    gc.freeze()
+    gc.set_threshold(*settings.gc_thresholds)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 import logging
-from flask import Flask, render_template, flash
+from flask import Flask, render_template, flash, request
+from jinja2 import FileSystemBytecodeCache
 from typing import Tuple
 from .config import settings
 from .app_routes import (
@@ -21,9 +22,13 @@ from .users.store import ensure_user_token_table
 from .db import close_cached_db
 
 from .cookies import CookieHeaderClient
+from .json_provider import OrjsonProvider
 
 logger = logging.getLogger("svg_translate")
 
+# 404s for these outside /static are scanner probes, never page or file titles.
+_PLAIN_404_SUFFIXES = (".php", ".asp", ".aspx", ".env", ".ico", ".xml", ".txt")
+
 
 def create_app() -> Flask:
     """Instantiate and configure the Flask application."""
@@ -34,6 +39,7 @@ def create_app() -> Flask:
         static_folder="../static",
     )
     app.url_map.strict_slashes = False
+    app.json = OrjsonProvider(app)
     app.test_client_class = CookieHeaderClient
     app.secret_key = settings.secret_key
     app.config.update(
@@ -43,6 +49,8 @@ def create_app() -> Flask:
     )
 
     app.config["USE_MW_OAUTH"] = settings.use_mw_oauth
+    # Hand file bodies to the front server (X-Sendfile) instead of streaming them from Python.
+    app.config["USE_X_SENDFILE"] = settings.use_x_sendfile
 
     if settings.use_mw_oauth and (
         settings.db_data.get("host")
@@ -63,6 +71,9 @@ def create_app() -> Flask:
         return context_user()
 
     app.jinja_env.globals.setdefault("USE_MW_OAUTH", settings.use_mw_oauth)
+    if settings.paths.jinja_cache_dir:
+        # lazy-apps workers each compile every template on first use; share the bytecode
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(settings.paths.jinja_cache_dir)
 
     @app.teardown_appcontext
     def _cleanup_connections(exception: Exception | None) -> None:  # pragma: no cover - teardown
@@ -70,8 +81,15 @@ def create_app() -> Flask:
         close_task_store()
 
     @app.errorhandler(404)
-    def page_not_found(e: Exception) -> Tuple[str, int]:
+    def page_not_found(e: Exception) -> Tuple[str, int] | Tuple[str, int, dict]:
         """Handle 404 errors"""
+        path = request.path
+        if path.startswith(f"{app.static_url_path}/") or path.lower().endswith(_PLAIN_404_SUFFIXES):
+            # Missing static files and scanner probes (*.php, *.env, favicon ...) get a
+            # plain body instead of a full page render with user lookup and flash. Page
+            # titles may contain dots (/explorer/foo.v2), so other paths keep the HTML page.
+            logger.debug("File not found: %s", request.path)
+            return "Not Found", 404, {"Content-Type": "text/plain; charset=utf-8"}
         logger.error("Page not found: %s", e)
         flash("Page not found", "warning")
         return render_template("error.html", title="Page Not Found", tt="invalid_url"), 404
@@ -84,3 +102,18 @@ def create_app() -> Flask:
         return render_template("error.html", title="Internal Server Error", tt="unexpected_error"), 500
 
     return app
+
+
+def prewarm_templates(app: Flask) -> None:
+    """Compile every template up front so no request pays for the first compile."""
+
+    for name in app.jinja_env.list_templates(extensions=["html"]):
+        app.jinja_env.get_template(name)
+
+
+def create_asgi_app():
+    """Return the Flask app wrapped for ASGI servers such as uvicorn."""
+
+    from asgiref.wsgi import WsgiToAsgi
+
+    return WsgiToAsgi(create_app())
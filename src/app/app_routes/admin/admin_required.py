@@ -12,8 +12,7 @@ from flask import (
 )
 from flask.typing import ResponseReturnValue
 
-from ...users.current import current_user
-from ...users.admin_service import active_coordinators
+from ...users.current import current_user, user_is_admin
 
 F = TypeVar("F", bound=Callable[..., ResponseReturnValue])
 
@@ -26,7 +25,7 @@ def admin_required(view: F) -> F:
         user = current_user()
         if not user:
             return redirect(url_for("auth.login"))
-        if user.username not in active_coordinators():
+        if not user_is_admin(user):
             abort(403)
         return view(*args, **kwargs)
 
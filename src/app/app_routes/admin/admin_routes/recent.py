@@ -12,7 +12,6 @@ from ...tasks.routes import (
     _task_store,
     format_task,
     format_task_message,
-    TASKS_LOCK,
 )
 from ..admin_required import admin_required
 
@@ -20,18 +19,16 @@ from ..admin_required import admin_required
 def _recent_routes():
     """Render the admin dashboard with summarized task information."""
 
-    with TASKS_LOCK:
-        db_tasks = _task_store().list_tasks(
-            order_by="created_at",
-            descending=True,
-        )
+    db_tasks = _task_store().list_tasks(
+        order_by="created_at",
+        descending=True,
+        include_payloads=False,
+    )
 
-    formatted = [format_task(task) for task in db_tasks]
-    formatted = format_task_message(formatted)
+    formatted = list(format_task_message(format_task(task) for task in db_tasks))
 
     status_counts = Counter(task.get("status", "Unknown") for task in formatted)
-    active_statuses = {"Running", "Pending"}
-    active_tasks = sum(1 for task in formatted if task.get("status") in active_statuses)
+    active_tasks = status_counts["Running"] + status_counts["Pending"]
 
     return render_template(
         "admins/admin.html",
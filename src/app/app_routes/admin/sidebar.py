@@ -1,3 +1,25 @@
+from functools import lru_cache
+
+MAIN_MENU_ICONS = {
+    "Translations": "bi-translate",
+    "Pages": "bi-file-text",
+    "Qids": "bi-database",
+    "Users": "bi-people",
+    "Others": "bi-three-dots",
+    "Tools": "bi-tools",
+}
+
+MAIN_MENU = {
+    "Users": [
+        {"id": "last", "admin": 0, "href": "recent", "title": "Recent", "icon": "bi-clock-history"},
+        {"id": "admins", "admin": 1, "href": "coordinators", "title": "Coordinators", "icon": "bi-person-gear"},
+        {"id": "templates", "admin": 1, "href": "templates", "title": "Templates", "icon": "bi-list-columns"},
+        {"id": "full_tr", "admin": 1, "href": "full_translators", "title": "Full translators", "icon": "bi-person-check"},
+        {"id": "user_inp", "admin": 1, "href": "users_no_inprocess", "title": "Not in process", "icon": "bi-hourglass"},
+    ]
+}
+
+_MENU_HREFS = frozenset(item["href"] for items in MAIN_MENU.values() for item in items)
 
 
 def generate_list_item(href, title, icon=None, target=None):
@@ -16,28 +38,16 @@ def generate_list_item(href, title, icon=None, target=None):
 
 def create_side(ty):
     """Generate sidebar HTML structure based on menu definitions."""
-    main_menu_icons = {
-        "Translations": "bi-translate",
-        "Pages": "bi-file-text",
-        "Qids": "bi-database",
-        "Users": "bi-people",
-        "Others": "bi-three-dots",
-        "Tools": "bi-tools",
-    }
+    # The markup only depends on which menu entry is active, so any other path segment
+    # shares the "nothing active" rendering and the cache stays bounded.
+    return _render_side(ty if ty in _MENU_HREFS else "")
 
-    main_menu = {
-        "Users": [
-            {"id": "last", "admin": 0, "href": "recent", "title": "Recent", "icon": "bi-clock-history"},
-            {"id": "admins", "admin": 1, "href": "coordinators", "title": "Coordinators", "icon": "bi-person-gear"},
-            {"id": "templates", "admin": 1, "href": "templates", "title": "Templates", "icon": "bi-list-columns"},
-            {"id": "full_tr", "admin": 1, "href": "full_translators", "title": "Full translators", "icon": "bi-person-check"},
-            {"id": "user_inp", "admin": 1, "href": "users_no_inprocess", "title": "Not in process", "icon": "bi-hourglass"},
-        ]
-    }
 
+@lru_cache(maxsize=None)
+def _render_side(ty):
     sidebar = ["<ul class='list-unstyled'>"]
 
-    for key, items in main_menu.items():
+    for key, items in MAIN_MENU.items():
         lis = []
         group_is_active = False
 
@@ -56,7 +66,7 @@ def create_side(ty):
         if lis:
             show = "show" if group_is_active else ""
             expanded = "true" if group_is_active else "false"
-            icon = main_menu_icons.get(key, "")
+            icon = MAIN_MENU_ICONS.get(key, "")
             icon_tag = f"<i class='bi {icon} me-1'></i>" if icon else ""
 
             group_html = f"""
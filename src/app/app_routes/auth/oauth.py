@@ -4,12 +4,24 @@ from __future__ import annotations
 
 import mwoauth
 import logging
-from typing import Tuple
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from typing import Dict, Tuple
+from urllib.parse import parse_qs
+
 from flask import url_for
 from ...config import settings
 
 logger = logging.getLogger("svg_translate")
 
+# Duplicate callbacks (double submits, replayed redirects) arriving while an exchange
+# for the same request token and verifier is in flight wait for it instead of sending
+# MediaWiki an already-used verifier. Entries only live while the exchange runs.
+TOKEN_EXCHANGE_WAIT = 30
+_exchanges: Dict[Tuple[str, str], Future] = {}
+_exchanges_lock = threading.Lock()
+
 IDENTITY_ERROR_MESSAGE = "We couldn’t verify your MediaWiki identity. Please try again."
 
 
@@ -21,7 +33,9 @@ class OAuthIdentityError(Exception):
         self.original_exception = original_exception
 
 
+@lru_cache(maxsize=1)
 def get_handshaker():
+    """Return the process-wide Handshaker; it only holds the consumer credentials."""
     if not settings.oauth:
         raise RuntimeError("MediaWiki OAuth configuration is incomplete")
 
@@ -46,8 +60,47 @@ def start_login(state_token: str) -> Tuple[str, object]:
 
 
 def complete_login(request_token, query_string: str):
-    """Complete the OAuth login flow and return the access token and user identity."""
+    """Complete the OAuth login flow and return the access token and user identity.
+
+    Concurrent calls for the same request token and verifier wait for the first
+    call's result rather than exchanging the verifier again.
+    """
+
+    token_key = getattr(request_token, "key", None)
+    verifier = parse_qs(query_string).get("oauth_verifier", [None])[0]
+    if not (token_key and verifier):
+        return _exchange_tokens(request_token, query_string)
+
+    key = (token_key, verifier)
+    with _exchanges_lock:
+        future = _exchanges.get(key)
+        leader = future is None
+        if leader:
+            future = _exchanges[key] = Future()
+
+    if not leader:
+        try:
+            return future.result(timeout=TOKEN_EXCHANGE_WAIT)
+        except FutureTimeoutError as exc:
+            raise OAuthIdentityError(
+                IDENTITY_ERROR_MESSAGE, original_exception=exc
+            ) from exc
 
+    try:
+        result = _exchange_tokens(request_token, query_string)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        # Waiters already hold the future; nothing (tokens included) outlives the exchange.
+        with _exchanges_lock:
+            _exchanges.pop(key, None)
+
+
+def _exchange_tokens(request_token, query_string: str):
     handshaker = get_handshaker()
     access_token = handshaker.complete(request_token, query_string)
     try:
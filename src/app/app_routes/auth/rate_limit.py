@@ -1,20 +1,35 @@
-"""Simple in-memory rate limiting for authentication endpoints."""
+"""Rate limiting for authentication endpoints.
+
+Limits are tracked in memory per worker by default. Setting ``RATE_LIMIT_REDIS_URL``
+moves them into Redis so every worker and process shares one count.
+"""
 
 from __future__ import annotations
 
-from collections import deque
+import logging
+import time
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta, timezone
 from threading import Lock
-from typing import Deque, Dict
+from typing import Deque, Union
+
+from ...config import settings
+
+logger = logging.getLogger("svg_translate")
 
 
 class RateLimiter:
-    """Track request timestamps per key and enforce a maximum rate."""
+    """Track request timestamps per key and enforce a maximum rate.
 
-    def __init__(self, limit: int, period: timedelta) -> None:
+    At most ``max_keys`` clients are tracked; the least recently seen key is
+    evicted first so memory stays bounded however many addresses hit the app.
+    """
+
+    def __init__(self, limit: int, period: timedelta, max_keys: int = 10_000) -> None:
         self._limit = limit
         self._period = period
-        self._hits: Dict[str, Deque[datetime]] = {}
+        self._max_keys = max_keys
+        self._hits: "OrderedDict[str, Deque[datetime]]" = OrderedDict()
         self._lock = Lock()
 
     def allow(self, key: str) -> bool:
@@ -22,7 +37,13 @@ class RateLimiter:
 
         now = datetime.now(timezone.utc)
         with self._lock:
-            hits = self._hits.setdefault(key, deque())
+            hits = self._hits.get(key)
+            if hits is None:
+                hits = self._hits[key] = deque()
+                if len(self._hits) > self._max_keys:
+                    self._hits.popitem(last=False)
+            else:
+                self._hits.move_to_end(key)
             while hits and now - hits[0] > self._period:
                 hits.popleft()
             if len(hits) >= self._limit:
@@ -35,7 +56,9 @@ class RateLimiter:
 
         now = datetime.now(timezone.utc)
         with self._lock:
-            hits = self._hits.setdefault(key, deque())
+            hits = self._hits.get(key)
+            if not hits:
+                return timedelta(0)
             while hits and now - hits[0] > self._period:
                 hits.popleft()
             if len(hits) >= self._limit:
@@ -44,5 +67,73 @@ class RateLimiter:
             return timedelta(0)
 
 
-login_rate_limiter = RateLimiter(limit=5, period=timedelta(minutes=1))
-callback_rate_limiter = RateLimiter(limit=10, period=timedelta(minutes=1))
+class RedisRateLimiter:
+    """Rolling-window limiter stored in a Redis sorted set per key.
+
+    Pruning, counting and recording a hit run in one Lua script, so concurrent
+    workers always see a consistent count. If Redis is unreachable the limiter
+    fails open and logs a warning; login should not break because of it.
+    """
+
+    _ALLOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], window)
+return 1
+"""
+
+    def __init__(self, url: str, name: str, limit: int, period: timedelta) -> None:
+        import redis  # optional dependency, only needed when RATE_LIMIT_REDIS_URL is set
+
+        self._client = redis.Redis.from_url(url)
+        self._errors = redis.RedisError
+        self._allow = self._client.register_script(self._ALLOW_SCRIPT)
+        self._prefix = f"svg_translate:ratelimit:{name}:"
+        self._limit = limit
+        self._window_ms = int(period.total_seconds() * 1000)
+
+    def allow(self, key: str) -> bool:
+        """Return True if the key is allowed to proceed, False when throttled."""
+
+        now_ns = time.time_ns()
+        try:
+            allowed = self._allow(
+                keys=[self._prefix + key],
+                args=[now_ns // 1_000_000, self._window_ms, self._limit, now_ns],
+            )
+        except self._errors:
+            logger.warning("Rate limiter backend unavailable; allowing %s", key, exc_info=True)
+            return True
+        return bool(allowed)
+
+    def try_after(self, key: str) -> timedelta:
+        """Return the time until the key is allowed to proceed."""
+
+        now_ms = time.time_ns() // 1_000_000
+        try:
+            pipe = self._client.pipeline()
+            pipe.zremrangebyscore(self._prefix + key, 0, now_ms - self._window_ms)
+            pipe.zcard(self._prefix + key)
+            pipe.zrange(self._prefix + key, 0, 0, withscores=True)
+            _, count, oldest = pipe.execute()
+        except self._errors:
+            logger.warning("Rate limiter backend unavailable for %s", key, exc_info=True)
+            return timedelta(0)
+        if count < self._limit or not oldest:
+            return timedelta(0)
+        return timedelta(milliseconds=max(0, self._window_ms - (now_ms - int(oldest[0][1]))))
+
+
+def _build_limiter(name: str, limit: int, period: timedelta) -> Union[RateLimiter, RedisRateLimiter]:
+    if settings.rate_limit_redis_url:
+        return RedisRateLimiter(settings.rate_limit_redis_url, name, limit, period)
+    return RateLimiter(limit=limit, period=period)
+
+
+login_rate_limiter = _build_limiter("login", limit=5, period=timedelta(minutes=1))
+callback_rate_limiter = _build_limiter("callback", limit=10, period=timedelta(minutes=1))
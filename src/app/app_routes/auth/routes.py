@@ -7,9 +7,8 @@ from __future__ import annotations
 import logging
 import secrets
 from collections.abc import Sequence
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable
-from urllib.parse import urlencode
 from flask import (
     Blueprint,
     flash,
@@ -39,12 +38,34 @@ bp_auth = Blueprint("auth", __name__)
 oauth_state_nonce = settings.STATE_SESSION_KEY
 request_token_key = settings.REQUEST_TOKEN_SESSION_KEY
 
+# Identity fields checked in order; MediaWiki reports the user id as "sub".
+_USER_ID_KEYS = ("sub", "id", "central_id", "user_id")
+_USERNAME_KEYS = ("username", "name")
+# Session entries owned by the login flow; /logout drops these and keeps the rest (flashes etc.).
+_LOGOUT_SESSION_KEYS = ("uid", "username", request_token_key, oauth_state_nonce)
+
 
 def _client_key() -> str:
-    forwarded_for = request.headers.get("X-Forwarded-For")
-    if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
-    return request.remote_addr or "anonymous"
+    """Return the rate-limit key for this request, resolved once and kept on ``g``."""
+    key = g.get("_client_key")
+    if key is None:
+        forwarded_for = request.headers.get("X-Forwarded-For")
+        if forwarded_for:
+            key = forwarded_for.split(",", 1)[0].strip()
+        else:
+            key = request.remote_addr or "anonymous"
+        g._client_key = key
+    return key
+
+
+@lru_cache(maxsize=64)
+def _index_error_url(script_root: str, error: str) -> str:
+    return url_for("main.index", error=error)
+
+
+def _error_url(error: str) -> str:
+    """Return the index URL carrying a fixed ``error`` code, built once per mount point."""
+    return _index_error_url(request.script_root, error)
 
 
 def _load_request_token(raw: Sequence[Any] | None):
@@ -66,7 +87,7 @@ def login_required(fn: Callable[..., Any]) -> Callable[..., Any]:
     def wrapper(*args, **kwargs):
         if not getattr(g, "is_authenticated", False):
             flash("You must be logged in to view this page", "warning")
-            return redirect(url_for("main.index", error="login-required"))
+            return redirect(_error_url("login-required"))
         return fn(*args, **kwargs)
 
     return wrapper
@@ -76,7 +97,7 @@ def login_required(fn: Callable[..., Any]) -> Callable[..., Any]:
 def login() -> Response:
     if not settings.use_mw_oauth:
         flash("OAuth login is disabled", "warning")
-        return redirect(url_for("main.index", error="oauth-disabled"))
+        return redirect(_error_url("oauth-disabled"))
 
     if not login_rate_limiter.allow(_client_key()):
         time_left = login_rate_limiter.try_after(_client_key()).total_seconds()
@@ -85,7 +106,6 @@ def login() -> Response:
         return redirect(url_for("main.index", error=f"Too many login attempts. Please try again after {time_left}s."))
 
     state_nonce = secrets.token_urlsafe(32)
-    session[oauth_state_nonce] = state_nonce
 
     # ------------------
     # start login
@@ -94,11 +114,14 @@ def login() -> Response:
     except Exception:
         logger.exception("Failed to start OAuth login")
         flash("Failed to initiate OAuth login", "danger")
-        return redirect(url_for("main.index", error="Failed to initiate OAuth login"))
+        return redirect(_error_url("Failed to initiate OAuth login"))
 
     # ------------------
-    # add request_token to session
-    session[request_token_key] = list(request_token)
+    # store the state nonce and request_token together; a failed start leaves the session untouched
+    session.update({
+        oauth_state_nonce: state_nonce,
+        request_token_key: list(request_token),
+    })
     return redirect(redirect_url)
 
 
@@ -108,13 +131,13 @@ def callback() -> Response:
     # use oauth
     if not settings.use_mw_oauth:
         flash("OAuth login is disabled", "warning")
-        return redirect(url_for("main.index", error="oauth-disabled"))
+        return redirect(_error_url("oauth-disabled"))
 
     # ------------------
     # callback rate limiter
     if not callback_rate_limiter.allow(_client_key()):
         flash("Too many login attempts", "warning")
-        return redirect(url_for("main.index", error="Too many login attempts"))
+        return redirect(_error_url("Too many login attempts"))
 
     # ------------------
     # verify state token
@@ -122,12 +145,12 @@ def callback() -> Response:
     returned_state = request.args.get("state")
     if not expected_state or not returned_state:
         flash("Invalid OAuth state", "danger")
-        return redirect(url_for("main.index", error="Invalid OAuth state"))
+        return redirect(_error_url("Invalid OAuth state"))
 
     verified_state = verify_state_token(returned_state)
     if verified_state != expected_state:
         flash("OAuth state mismatch", "danger")
-        return redirect(url_for("main.index", error="oauth-state-mismatch"))
+        return redirect(_error_url("oauth-state-mismatch"))
 
     # ------------------
     # token data
@@ -135,64 +158,62 @@ def callback() -> Response:
     oauth_verifier = request.args.get("oauth_verifier")
     if not raw_request_token or not oauth_verifier:
         flash("Invalid OAuth verifier", "danger")
-        return redirect(url_for("main.index", error="Invalid OAuth verifier"))
+        return redirect(_error_url("Invalid OAuth verifier"))
 
     # ------------------
     # RequestToken
     try:
         request_token = _load_request_token(raw_request_token)
-    except ValueError:
-        logger.exception("Invalid OAuth request token")
+    except ValueError as exc:
+        logger.warning("Invalid OAuth request token: %s", exc)
         flash("Invalid OAuth request token", "danger")
-        return redirect(url_for("main.index", error="Invalid request token"))
+        return redirect(_error_url("Invalid request token"))
 
     # ------------------
     # access_token, identity
     try:
-        query_string = urlencode(request.args)
+        # Hand mwoauth the callback query verbatim instead of re-encoding request.args.
+        query_string = request.query_string.decode("utf-8", "replace")
         access_token, identity = complete_login(request_token, query_string)
     except OAuthIdentityError:
         logger.exception("OAuth identity verification failed")
         flash("Failed to verify OAuth identity", "danger")
-        return redirect(url_for("main.index", error="Failed to verify OAuth identity"))
+        return redirect(_error_url("Failed to verify OAuth identity"))
 
     # ------------------
     # access_key, access_secret
     token_key = getattr(access_token, "key", None)
     token_secret = getattr(access_token, "secret", None)
 
-    if not (token_key and token_secret) and isinstance(access_token, Sequence):
-        token_key = access_token[0]
-        token_secret = access_token[1]
+    if not (token_key and token_secret):
+        try:
+            token_key, token_secret = access_token[0], access_token[1]
+        except (TypeError, IndexError, KeyError):
+            pass
 
     if not (token_key and token_secret):
         logger.error("OAuth access token missing key/secret")
         flash("Missing OAuth credentials", "danger")
-        return redirect(url_for("main.index", error="Missing credentials"))
+        return redirect(_error_url("Missing credentials"))
 
     # ------------------
     # user info
-    user_identifier = (
-        identity.get("sub")
-        or identity.get("id")
-        or identity.get("central_id")
-        or identity.get("user_id")
-    )
+    user_identifier = next((identity[k] for k in _USER_ID_KEYS if identity.get(k)), None)
     if not user_identifier:
         flash("Missing user id", "danger")
-        return redirect(url_for("main.index", error="Missing id"))
+        return redirect(_error_url("Missing id"))
 
     try:
         user_id = int(user_identifier)
     except (TypeError, ValueError):
-        logger.exception("Invalid user identifier")
+        logger.warning("Invalid user identifier: %r", user_identifier)
         flash("Invalid user identifier", "danger")
-        return redirect(url_for("main.index", error="Invalid user identifier"))
+        return redirect(_error_url("Invalid user identifier"))
 
-    username = identity.get("username") or identity.get("name")
+    username = next((identity[k] for k in _USERNAME_KEYS if identity.get(k)), None)
     if not username:
         flash("Missing username", "danger")
-        return redirect(url_for("main.index", error="Missing username"))
+        return redirect(_error_url("Missing username"))
 
     # ------------------
     # upsert credentials
@@ -238,10 +259,9 @@ def callback() -> Response:
 # @login_required
 # Users with stale cookies will be redirected with a "login-required" error instead of being able to clean up their authentication state
 def logout() -> Response:
-    user_id = session.pop("uid", None)
-    session.pop(request_token_key, None)
-    session.pop(oauth_state_nonce, None)
-    session.pop("username", None)
+    user_id = session.get("uid")
+    for key in _LOGOUT_SESSION_KEYS:
+        session.pop(key, None)
 
     # extract user_id from signed cookie if needed
     if user_id is None:
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import threading
-import uuid
+import secrets
 import logging
 from functools import wraps
 from typing import Any, Dict, Callable
@@ -16,29 +15,18 @@ from flask import (
 from flask.wrappers import Response
 from werkzeug.datastructures import MultiDict
 
-from ...config import settings
-from ...db.task_store_pymysql import TaskStorePyMysql
 from ...db import TaskAlreadyExistsError
-from ...users.current import current_user
-from ...users.admin_service import active_coordinators
+from ...users.current import current_user, user_is_admin
 from ..tasks.args_utils import parse_args
+from ..tasks.routes import _task_store, forget_task_status
 
-from ...threads.task_threads import launch_task_thread, get_cancel_event
-
-TASK_STORE: TaskStorePyMysql | None = None
-TASKS_LOCK = threading.Lock()
+from ...threads.task_threads import launch_task_thread, get_cancel_event, release_active_title
+from ...threads.title_locks import title_lock
 
 bp_tasks_managers = Blueprint("tasks_managers", __name__)
 logger = logging.getLogger("svg_translate")
 
 
-def _task_store() -> TaskStorePyMysql:
-    global TASK_STORE
-    if TASK_STORE is None:
-        TASK_STORE = TaskStorePyMysql(settings.db_data)
-    return TASK_STORE
-
-
 def login_required_json(fn: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator that redirects anonymous users to the index page."""
 
@@ -74,7 +62,7 @@ def cancel(task_id: str):
 
     task_username = task.get("username", "")
 
-    if task_username != user.username and user.username not in active_coordinators():
+    if task_username != user.username and not user_is_admin(user):
         logger.error(
             "Cancel requested for task %s by user %s, but task is owned by %s",
             task_id,
@@ -88,6 +76,9 @@ def cancel(task_id: str):
         cancel_event.set()
 
     store.update_status(task_id, "Cancelled")
+    forget_task_status(task_id)
+    # The runner may still be winding down; free the title now so a resubmission is accepted.
+    release_active_title(task.get("title", ""), task_id)
 
     return jsonify({"task_id": task_id, "status": "Cancelled"})
 
@@ -121,13 +112,12 @@ def restart(task_id: str):
         "access_secret": user.access_secret,
     }
 
-    stored_form = dict(task.get("form") or {})
-    request_form = MultiDict(stored_form.items()) if stored_form else MultiDict()
-    args = parse_args(request_form)
+    stored_form = task.get("form") or {}
+    args = parse_args(MultiDict(stored_form))
 
-    new_task_id = uuid.uuid4().hex
+    new_task_id = secrets.token_hex(16)
 
-    with TASKS_LOCK:
+    with title_lock(title):
         try:
             store.create_task(
                 new_task_id,
@@ -146,7 +136,9 @@ def restart(task_id: str):
             logger.exception("Failed to restart task %s", task_id)
             return jsonify({"error": "task-create-failed"}), 500
 
-    launch_task_thread(new_task_id, title, args, user_payload)
+    if not launch_task_thread(new_task_id, title, args, user_payload):
+        store.delete_task(new_task_id)
+        return jsonify({"error": "queue-full"}), 503
 
     return jsonify({"task_id": new_task_id, "status": "Running"})
 
@@ -22,7 +22,7 @@ def file_langs(file_path: Path):
             if text.get("systemLanguage"):
                 languages.add(text.get("systemLanguage"))
     except (etree.XMLSyntaxError, OSError):
-        logger.exception(f"Error parsing SVG file: {file_path}")
+        logger.exception("Error parsing SVG file: %s", file_path)
     # ---
     return list(languages)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import logging
+import os
 from flask import (
     Blueprint,
     render_template,
@@ -63,7 +64,8 @@ def by_title_not_translated(title_dir: str):
 
     title = get_temp_title(title_dir)
 
-    not_translated = [x for x in downloaded if x not in set(translated)]
+    translated_set = set(translated)
+    not_translated = [x for x in downloaded if x not in translated_set]
 
     return render_template(
         "explorer/explore_files.html",
@@ -88,11 +90,8 @@ def by_title(title: str):
 
 @bp_explorer.get("/")
 def main():
-    titles = [
-        x.name
-        for x in svg_data_path.iterdir()
-        if x.is_dir()
-    ]
+    with os.scandir(svg_data_path) as entries:
+        titles = [entry.name for entry in entries if entry.is_dir()]
     data = {}
     for title in titles:
         downloaded, _ = get_files(title, "files")
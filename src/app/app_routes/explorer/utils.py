@@ -1,7 +1,15 @@
 
-import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+import orjson
+
 from ...config import settings
 
 logger = logging.getLogger("svg_translate")
@@ -12,9 +20,21 @@ logger = logging.getLogger("svg_translate")
 svg_data_path = Path(settings.paths.svg_data)
 svg_data_thumb_path = Path(settings.paths.svg_data_thumb)
 
+FILE_CACHE_SIZE = 512
+_file_cache: "OrderedDict[Hashable, Tuple[int, int, Any]]" = OrderedDict()
+_file_cache_lock = threading.Lock()
+
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
 
+
+@lru_cache(maxsize=1024)
 def _validate_path_under_base(title: str, sub_dir: str) -> Path:
-    """Resolve and validate that title/sub_dir is confined under BASE_SVG."""
+    """Resolve and validate that title/sub_dir is confined under BASE_SVG.
+
+    ``resolve()`` walks every path component, so accepted paths are memoized;
+    rejected ones raise and are checked again on the next call.
+    """
     try:
         candidate = (svg_data_path / title / sub_dir).resolve()
     except (ValueError, OSError):
@@ -26,15 +46,50 @@ def _validate_path_under_base(title: str, sub_dir: str) -> Path:
     return candidate
 
 
+def _read_cached(file_path: Path, loader: Callable[[Path], Any], key: Hashable = None) -> Any:
+    """Return ``loader(file_path)``, reusing the previous result while the file is unchanged.
+
+    Entries are keyed on ``key`` (the path by default) and validated against
+    ``st_mtime_ns``/``st_size``, so a warm hit costs one ``stat`` call. Pass a distinct
+    ``key`` to cache a value derived from a file that is also cached raw.
+    Raises ``FileNotFoundError`` if the file is missing.
+    """
+    if key is None:
+        key = file_path
+    stat = file_path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _file_cache_lock:
+        cached = _file_cache.get(key)
+        if cached is not None and cached[:2] == version:
+            _file_cache.move_to_end(key)
+            return cached[2]
+
+    value = loader(file_path)
+
+    with _file_cache_lock:
+        _file_cache[key] = (*version, value)
+        _file_cache.move_to_end(key)
+        while len(_file_cache) > FILE_CACHE_SIZE:
+            _file_cache.popitem(last=False)
+    return value
+
+
+def _load_json(file_path: Path) -> Any:
+    return orjson.loads(file_path.read_bytes())
+
+
+def _load_text(file_path: Path) -> str:
+    return file_path.read_text(encoding="utf-8").strip()
+
+
 def get_main_data(title, filename="files_stats.json"):
     file_path = svg_data_path / title / (filename or "files_stats.json")
-    if not file_path.exists():
-        return {}
     try:
-        data = json.loads(file_path.read_text(encoding="utf-8"))
-        return data
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
-        logger.exception(f"Failed to read or parse {file_path}")
+        return _read_cached(file_path, _load_json)
+    except FileNotFoundError:
+        return {}
+    except (orjson.JSONDecodeError, OSError):
+        logger.exception("Failed to read or parse %s", file_path)
         return {}
 
 
@@ -44,15 +99,16 @@ def get_files_full_path(title, sub_dir):
     try:
         title_path = _validate_path_under_base(title, sub_dir)
     except PermissionError as e:
-        logger.warning(str(e))
+        logger.warning("%s", e)
         return [], svg_data_path / title / sub_dir
 
-    if not title_path.exists():
-        logger.error(f"Title path {title_path} does not exist")
+    try:
+        with os.scandir(title_path) as entries:
+            files = [entry.name for entry in entries]
+    except FileNotFoundError:
+        logger.error("Title path %s does not exist", title_path)
         return [], title_path
 
-    files = [str(x.name) for x in title_path.glob("*")]
-
     return files, title_path
 
 
@@ -61,27 +117,22 @@ def get_files(title, sub_dir):
     try:
         title_path = _validate_path_under_base(title, sub_dir)
     except PermissionError as e:
-        logger.warning(str(e))
+        logger.warning("%s", e)
         return [], svg_data_path / title / sub_dir
 
-    if not title_path.exists():
-        logger.error(f"Title path {title_path} does not exist")
+    try:
+        with os.scandir(title_path) as entries:
+            files = [entry.name for entry in entries if entry.name.endswith(".svg") and entry.is_file()]
+    except FileNotFoundError:
+        logger.error("Title path %s does not exist", title_path)
         return [], title_path
 
-    files = [
-        x.name
-        for x in title_path.glob("*.svg")
-    ]
-
     return files, title_path
 
 
-def get_languages(title: str, translations_data: dict|None=None) -> list:
-    # ---
-    languages = []
+def _collect_languages(translations_data: dict) -> List[str]:
     # ---
-    if not translations_data:
-        translations_data = get_main_data(title, "translations.json") or {}
+    languages = set()
     # ---
     new = translations_data.get("new", {})
     # ---
@@ -89,16 +140,37 @@ def get_languages(title: str, translations_data: dict|None=None) -> list:
         if key == "default_tspans_by_id":
             continue
         if isinstance(v, dict):
-            languages.extend(v.keys())
+            languages.update(v)
     # ---
-    return sorted(set(languages))
+    return sorted(languages)
+
+
+def _load_languages(file_path: Path) -> List[str]:
+    return _collect_languages(_load_json(file_path) or {})
+
+
+def get_languages(title: str, translations_data: dict|None=None) -> list:
+    if translations_data:
+        return _collect_languages(translations_data)
+    # ---
+    file_path = svg_data_path / title / "translations.json"
+    try:
+        return _read_cached(file_path, _load_languages, key=(file_path, "languages"))
+    except FileNotFoundError:
+        return []
+    except (orjson.JSONDecodeError, OSError):
+        logger.exception("Failed to read or parse %s", file_path)
+        return []
 
 
 def get_temp_title(title):
     temp_title = title
     temp_title_path = svg_data_path / title / "title.txt"
 
-    text = temp_title_path.read_text(encoding="utf-8").strip() if temp_title_path.exists() else ""
+    try:
+        text = _read_cached(temp_title_path, _load_text)
+    except FileNotFoundError:
+        text = ""
 
     temp_title = text.strip() if text.strip() else title
 
@@ -106,6 +178,34 @@ def get_temp_title(title):
 
 
 def get_informations(title):
+    """Return the folder summary for ``title``.
+
+    Concurrent requests for the same title share one computation: the first caller
+    builds the result and the others wait on its future instead of rescanning.
+    """
+    with _inflight_lock:
+        future = _inflight.get(title)
+        leader = future is None
+        if leader:
+            future = _inflight[title] = Future()
+
+    if not leader:
+        return future.result()
+
+    try:
+        result = _build_informations(title)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(title, None)
+
+
+def _build_informations(title):
     data = {}
     downloaded, title_path = get_files(title, "files")
     translated, _ = get_files(title, "translated")
@@ -115,16 +215,17 @@ def get_informations(title):
 
     main_file = data.get("main_title", "")
 
-    if main_file and not main_file.lower().startswith("file:"):
+    if main_file and main_file[:5].lower() != "file:":
         main_file = f"File:{main_file}"
 
     languages = get_languages(title, data.get("translations"))
 
     # not_translated = set(downloaded).difference(translated)
-    not_translated = [x for x in downloaded if x not in set(translated)]
+    translated_set = set(translated)
+    not_translated = [x for x in downloaded if x not in translated_set]
     downloaded_set = {f.lower() for f in downloaded}
     not_downloaded = [
-        (f"File:{x}" if not x.lower().startswith("file:") else x)
+        (x if x[:5].lower() == "file:" else f"File:{x}")
         for x in data.get("titles", [])
         if x.lower() not in downloaded_set
     ]
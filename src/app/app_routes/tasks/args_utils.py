@@ -7,8 +7,19 @@ from ...config import settings
 
 logger = logging.getLogger("svg_translate")
 
-
-@dataclass(frozen=True)
+# Submitted fields that are persisted with a task: what the task pages render and
+# what restart feeds back into parse_args. Anything else in the POST is dropped.
+FORM_FIELDS = (
+    "title",
+    "manual_main_title",
+    "titles_limit",
+    "overwrite",
+    "upload",
+    "ignore_existing_task",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Args:
     titles_limit: int
     overwrite: bool
@@ -37,3 +48,8 @@ def parse_args(request_form) -> Args:
         upload=upload,
         manual_main_title=manual_main_title,
     )
+
+
+def form_snapshot(request_form) -> dict:
+    """Return the submitted :data:`FORM_FIELDS` that are present in ``request_form``."""
+    return {key: request_form[key] for key in FORM_FIELDS if key in request_form}
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import threading
-import uuid
+import secrets
 import logging
+from typing import Tuple
+
+from cachetools import TTLCache
 from flask import (
     Blueprint,
+    current_app,
     jsonify,
     flash,
     redirect,
@@ -23,32 +27,67 @@ from ...app_routes.admin.admin_required import admin_required
 
 from ...routes_utils import load_auth_payload, get_error_message, format_task, order_stages
 
-from ...threads.task_threads import launch_task_thread
+from ...threads.task_threads import get_active_task_id, launch_task_thread
+from ...threads.title_locks import title_lock
 
-from .args_utils import parse_args
+from .args_utils import form_snapshot, parse_args
 
 TASK_STORE: TaskStorePyMysql | None = None
-TASKS_LOCK = threading.Lock()
+_TASK_STORE_LOCK = threading.Lock()
+
+# The progress page polls /status several times per second per open tab; a sub-second
+# TTL collapses those polls into roughly one query per task without visibly lagging.
+STATUS_CACHE_TTL = 0.5
+_status_cache: TTLCache = TTLCache(maxsize=4096, ttl=STATUS_CACHE_TTL)
+_status_cache_lock = threading.Lock()
 
 bp_tasks = Blueprint("tasks", __name__)
 logger = logging.getLogger("svg_translate")
 
 
 def format_task_message(formatted):
+    """Yield each formatted task with stage messages split onto separate lines."""
     for v in formatted:
-        if v.get('stages'):
-            for s in v['stages']:
-                v['stages'][s]['message'] = '<br>'.join(v['stages'][s]['message'].split(','))
-    return formatted
+        for stage in (v.get('stages') or {}).values():
+            stage['message'] = stage['message'].replace(',', '<br>')
+        yield v
 
 
 def _task_store() -> TaskStorePyMysql:
     global TASK_STORE
     if TASK_STORE is None:
-        TASK_STORE = TaskStorePyMysql(settings.db_data)
+        # Request threads share this store; only the first one may build it.
+        with _TASK_STORE_LOCK:
+            if TASK_STORE is None:
+                TASK_STORE = TaskStorePyMysql(settings.db_data)
     return TASK_STORE
 
 
+def _status_payload(task_id: str) -> Tuple[bytes, str] | None:
+    """Return the serialized ``get_task(task_id)`` and its ETag, reused within ``STATUS_CACHE_TTL``.
+
+    Caching the encoded body lets repeated polls skip both the query and the JSON encoding.
+    """
+    with _status_cache_lock:
+        payload = _status_cache.get(task_id)
+    if payload is None:
+        task = _task_store().get_task(task_id)
+        if not task:
+            return None
+        response = jsonify(task)
+        response.add_etag()
+        payload = (response.get_data(), response.get_etag()[0])
+        with _status_cache_lock:
+            _status_cache[task_id] = payload
+    return payload
+
+
+def forget_task_status(task_id: str) -> None:
+    """Drop the cached status of ``task_id`` after a write made by this process."""
+    with _status_cache_lock:
+        _status_cache.pop(task_id, None)
+
+
 def close_task_store() -> None:
     """Close the cached :class:`TaskStorePyMysql` instance if present."""
     global TASK_STORE
@@ -126,33 +165,36 @@ def task2():
 @oauth_required
 def start():
     user = current_user()
-    title = request.form.get("title", "").strip()
+    form = request.form
+    title = form.get("title", "").strip()
     if not title:
         return redirect(url_for("main.index"))
 
-    task_id = uuid.uuid4().hex
+    task_id = secrets.token_hex(16)
 
     store = _task_store()
 
-    args = parse_args(request.form)
+    args = parse_args(form)
 
-    with TASKS_LOCK:
-        logger.info(f"ignore_existing_task: {args.ignore_existing_task}")
-        if not args.ignore_existing_task:
-            existing_task = store.get_active_task_by_title(title)
-            if existing_task:
-                logger.debug(f"Task for title '{title}' already exists: {existing_task['id']}.")
-                flash(f"Task for title '{title}' already exists: {existing_task['id']}.", "warning")
-                return redirect(
-                    url_for("tasks.task", task_id=existing_task["id"], title=title)
-                )
+    active_task_id = None if args.ignore_existing_task else get_active_task_id(title)
+    # A hit is answered from memory. A cancel in this worker releases the title at once;
+    # one handled by another worker does so when the runner's next cancel check reads
+    # the stored status. Misses fall through to create_task's SQL check.
+    if active_task_id:
+        flash(f"Task for title '{title}' already exists: {active_task_id}.", "warning")
+        return redirect(url_for("tasks.task", task_id=active_task_id, title=title))
 
+    with title_lock(title):
+        logger.info(f"ignore_existing_task: {args.ignore_existing_task}")
+        # create_task performs the active-task lookup itself (unless ignore_existing_task
+        # is set) and raises TaskAlreadyExistsError, so the title is normalized and
+        # queried once per submission.
         try:
             store.create_task(
                 task_id,
                 title,
                 username=(user.username if user else ""),
-                form=request.form.to_dict(flat=True)
+                form=form_snapshot(form),
             )
         except TaskAlreadyExistsError as exc:
             existing = exc.task
@@ -166,7 +208,16 @@ def start():
 
     auth_payload = load_auth_payload(user)
 
-    launch_task_thread(task_id, title, args, auth_payload)
+    if not launch_task_thread(task_id, title, args, auth_payload):
+        store.delete_task(task_id)
+        return (
+            render_template(
+                "error.html",
+                title="Server Busy",
+                error="Too many tasks are running right now. Please try again in a few minutes.",
+            ),
+            503,
+        )
 
     return redirect(url_for("tasks.task", title=title, task_id=task_id))
 
@@ -181,17 +232,23 @@ def status(task_id: str):
 
     Returns:
         A JSON response containing the task data when found. If no task exists for `task_id`, a JSON error `{"error": "not-found"}` is returned with HTTP status 404.
+        The response carries an ETag, so polls sending a matching `If-None-Match` get an empty 304.
     """
     if not task_id:
         logger.error("No task_id provided in status request.")
         return jsonify({"error": "no-task-id"}), 400
 
-    task = _task_store().get_task(task_id)
-    if not task:
+    payload = _status_payload(task_id)
+    if not payload:
         logger.debug(f"Task {task_id} not found")
         return jsonify({"error": "not-found"}), 404
 
-    return jsonify(task)
+    body, etag = payload
+    response = current_app.response_class(body, mimetype="application/json")
+    # Let browsers keep the body but revalidate every poll against the ETag.
+    response.cache_control.no_cache = True
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 
 @bp_tasks.get("/tasks")
@@ -203,28 +260,26 @@ def tasks(user: str | None = None):
     Retrieve tasks from the global task store, optionally filter by status, and produce a list of task dictionaries with selected fields and display/sortable timestamp values. Also collect the distinct task statuses found and pass the tasks, the current status filter, and the sorted available statuses to the "tasks.html" template.
 
     Returns:
-        A Flask response object rendering "tasks.html" with the context keys `tasks`, and `available_statuses`.
+        A Flask response rendering "tasks.html" with the context keys `tasks`, and `available_statuses`.
     """
 
     # Get username from query parameter, default to current user
     # user = request.args.get("user", "")
     current_user_obj = current_user()
 
-    with TASKS_LOCK:
-        db_tasks = _task_store().list_tasks(
-            username=user,
-            order_by="created_at",
-            descending=True,
-        )
+    db_tasks = _task_store().list_tasks(
+        username=user,
+        order_by="created_at",
+        descending=True,
+        include_payloads=False,
+    )
 
-    formatted = [format_task(task) for task in db_tasks]
-    formatted = format_task_message(formatted)
+    # Rows are formatted lazily as the template loop consumes them, so no second list of
+    # formatted tasks is built. render_template rather than stream_template: base.html
+    # pops the flashed messages, which only sticks if it runs before the session is saved.
+    formatted = format_task_message(format_task(task) for task in db_tasks)
 
-    available_statuses = sorted(
-        {
-            task.get("status", "") for task in db_tasks if task.get("status")
-        }
-    )
+    available_statuses = sorted({status for task in db_tasks if (status := task.get("status"))})
 
     # Determine if viewing own tasks or another user's tasks
     is_own_tasks = current_user_obj and user == current_user_obj.username
@@ -2,46 +2,59 @@
 
 from pathlib import Path
 import logging
+import os
 import re
-import json
+import threading
+
+from cachetools import TTLCache
 
 from flask import (
     Blueprint,
     render_template,
 )
 from ...web.commons.category import get_category_members
+from ..explorer.utils import get_main_data
 from ...config import settings
 from ...template_service import get_templates_db, add_or_update_template
 
 bp_templates = Blueprint("templates", __name__, url_prefix="/templates")
 logger = logging.getLogger("svg_translate")
 
+# Same slug rule as web_run_task._compute_output_dir.
+_UNSAFE_SLUG_CHARS = re.compile(r'[^A-Za-z0-9._\- ]+')
+
+# The index fetches a category from Commons and probes every template's folder;
+# repeat views within this window reuse the previous result.
+TEMPLATES_CACHE_TTL = 60
+_templates_cache: TTLCache = TTLCache(maxsize=1, ttl=TEMPLATES_CACHE_TTL)
+_templates_cache_lock = threading.Lock()
+
 
-def get_main_data(title):
-    file_path = Path(settings.paths.svg_data) / title / "files_stats.json"
-    if not file_path.exists():
-        return {}
+def existing_title_dirs() -> set:
+    """Return the names of the data folders under ``svg_data`` from a single directory scan."""
     try:
-        data = json.loads(file_path.read_text(encoding="utf-8"))
-        return data
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
-        logger.exception(f"Failed to read or parse {file_path}")
-        return {}
+        with os.scandir(settings.paths.svg_data) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
 
 
-def temp_data(temp: str) -> dict:
+def temp_data(temp: str, existing: set | None = None) -> dict:
     result = {
         "title_dir": "",
         "main_file": "",
     }
     # ---
     title_dir = Path(temp).name
-    title_dir = re.sub(r'[^A-Za-z0-9._\- ]+', "_", str(title_dir)).strip("._") or "untitled"
+    title_dir = _UNSAFE_SLUG_CHARS.sub("_", str(title_dir)).strip("._") or "untitled"
     title_dir = title_dir.replace(" ", "_").lower()
     # ---
-    out = Path(settings.paths.svg_data) / title_dir
+    if existing is None:
+        found = (Path(settings.paths.svg_data) / title_dir).exists()
+    else:
+        found = title_dir in existing
     # ---
-    if out.exists():
+    if found:
         result["title_dir"] = title_dir
     # ---
     return result
@@ -77,8 +90,13 @@ def temps_main_files(data: dict) -> dict:
     return data
 
 
-@bp_templates.get("/")
-def main():
+def templates_data() -> dict:
+    """Return the owidslider templates with their data folder and main file, cached for ``TEMPLATES_CACHE_TTL``."""
+    with _templates_cache_lock:
+        cached = _templates_cache.get("data")
+    if cached is not None:
+        return cached
+
     templates = get_category_members("Category:Pages using gadget owidslider")
 
     templates = [
@@ -87,8 +105,9 @@ def main():
         and x.lower() not in ["template:owidslider", "template:owid"]
     ]
 
+    existing = existing_title_dirs()
     data = {
-        temp : temp_data(temp)
+        temp : temp_data(temp, existing)
         for temp in templates
     }
 
@@ -97,6 +116,16 @@ def main():
     # sort data by if they have main_file
     data = dict(sorted(data.items(), key=lambda x: x[1].get("main_file", ""), reverse=True))
 
+    if data:
+        with _templates_cache_lock:
+            _templates_cache["data"] = data
+    return data
+
+
+@bp_templates.get("/")
+def main():
+    data = templates_data()
+
     return render_template(
         "templates/index.html",
         data=data
@@ -6,7 +6,12 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 from functools import lru_cache
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+
+
+# gc.set_threshold() values applied with tune_gc: the loaded app is frozen into the
+# permanent generation, so young collections can run far less often.
+GC_THRESHOLDS: Tuple[int, int, int] = (50000, 500, 1000)
 
 
 @dataclass(frozen=True)
@@ -23,6 +28,7 @@ class Paths:
     svg_data: str
     svg_data_thumb: str
     log_dir: str
+    jinja_cache_dir: str
 
 
 @dataclass(frozen=True)
@@ -56,6 +62,11 @@ class Settings:
     oauth: Optional[OAuthConfig]
     paths: Paths
     disable_uploads: str
+    use_x_sendfile: bool = False
+    oauth_decrypt_cache_ttl: int = 0
+    rate_limit_redis_url: str = ""
+    tune_gc: bool = False
+    gc_thresholds: Tuple[int, int, int] = GC_THRESHOLDS
 
 
 def _load_db_data_new() -> DbConfig:
@@ -93,23 +104,32 @@ def _get_paths() -> Paths:
 
     log_dir = os.getenv("LOG_PATH") or f"{os.path.expanduser('~')}/logs"
 
+    # Optional: compiled templates are shared between workers when set
+    jinja_cache_dir = os.getenv("JINJA_CACHE_PATH", "")
+
     # Ensure directories exist
     Path(svg_data).mkdir(parents=True, exist_ok=True)
     Path(log_dir).mkdir(parents=True, exist_ok=True)
     Path(svg_data_thumb).mkdir(parents=True, exist_ok=True)
+    if jinja_cache_dir:
+        Path(jinja_cache_dir).mkdir(parents=True, exist_ok=True)
 
     return Paths(
         svg_data=svg_data,
         svg_data_thumb=svg_data_thumb,
-        log_dir=log_dir
+        log_dir=log_dir,
+        jinja_cache_dir=jinja_cache_dir,
     )
 
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
 def _env_bool(name: str, default: bool = False) -> bool:
     value = os.getenv(name)
     if value is None:
         return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    return value.strip().lower() in _TRUTHY
 
 
 def _env_int(name: str, default: int) -> int:
@@ -186,7 +206,11 @@ def get_settings() -> Settings:
         oauth_encryption_key=oauth_encryption_key,
         cookie=cookie,
         oauth=oauth_config,
-        disable_uploads=os.getenv("DISABLE_UPLOADS", "")
+        disable_uploads=os.getenv("DISABLE_UPLOADS", ""),
+        use_x_sendfile=_env_bool("USE_X_SENDFILE", default=False),
+        oauth_decrypt_cache_ttl=_env_int("OAUTH_DECRYPT_CACHE_TTL", 0),
+        rate_limit_redis_url=os.getenv("RATE_LIMIT_REDIS_URL", ""),
+        tune_gc=_env_bool("SVG_TUNE_GC", default=False),
     )
 
 
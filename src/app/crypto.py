@@ -1,24 +1,27 @@
 """Symmetric encryption helpers for storing OAuth secrets."""
 
 from __future__ import annotations
-import os
 
 import threading
+from functools import cache
 
+from cachetools import TTLCache
 from cryptography.fernet import Fernet, InvalidToken
 
 from .config import settings
 
-_fernet: Fernet | None = None
-# _fernet_lock = threading.Lock()
+# Opt-in (OAUTH_DECRYPT_CACHE_TTL > 0): keeps decrypted OAuth secrets in process
+# memory for that many seconds so repeated lookups skip the HMAC check and AES.
+_decrypt_cache: TTLCache | None = (
+    TTLCache(maxsize=4096, ttl=settings.oauth_decrypt_cache_ttl)
+    if settings.oauth_decrypt_cache_ttl > 0
+    else None
+)
+_decrypt_cache_lock = threading.Lock()
 
 
+@cache
 def _require_fernet() -> Fernet:
-    global _fernet
-
-    if _fernet is not None:
-        return _fernet
-
     if not settings.oauth_encryption_key:
         raise RuntimeError(
             "OAUTH_ENCRYPTION_KEY must be configured before using the crypto helpers"
@@ -29,16 +32,13 @@ def _require_fernet() -> Fernet:
         if isinstance(settings.oauth_encryption_key, str)
         else settings.oauth_encryption_key
     )
-    # with _fernet_lock:
 
     try:
-        _fernet = Fernet(key_bytes)
+        return Fernet(key_bytes)
     except ValueError as exc:
         # Key must be a 32‑byte urlsafe base64‑encoded string
         raise RuntimeError("Invalid OAUTH_ENCRYPTION_KEY format") from exc
 
-    return _fernet
-
 
 def encrypt_value(value: str) -> bytes:
     """Encrypt a UTF-8 string and return the raw Fernet token bytes."""
@@ -49,8 +49,20 @@ def encrypt_value(value: str) -> bytes:
 def decrypt_value(token: bytes) -> str:
     """Decrypt a Fernet token and return the UTF-8 string contents."""
 
+    if _decrypt_cache is not None:
+        token = bytes(token)
+        with _decrypt_cache_lock:
+            cached = _decrypt_cache.get(token)
+        if cached is not None:
+            return cached
+
     try:
         decrypted = _require_fernet().decrypt(token)
     except InvalidToken as exc:
         raise ValueError("Unable to decrypt stored token") from exc
-    return decrypted.decode("utf-8")
+    value = decrypted.decode("utf-8")
+
+    if _decrypt_cache is not None:
+        with _decrypt_cache_lock:
+            _decrypt_cache[token] = value
+    return value
@@ -90,9 +90,9 @@ class CreateUpdateTask:  # (StageStore, TasksListDB, DbUtils):
         """
         now = self._current_ts()
         normalized_name = self._normalize_title(title)
-        # Application-level guard to ensure at most one active task per normalized_name.
-        # with self._lock:
-        if not form or not form.get("ignore_existing_task"):
+        check_existing = not form or not form.get("ignore_existing_task")
+        # Return the existing task (with stages) when one is active for normalized_name.
+        if check_existing:
             # Check for an existing active task
             rows = self.db.fetch_query(
                 f"""
@@ -123,28 +123,47 @@ class CreateUpdateTask:  # (StageStore, TasksListDB, DbUtils):
                     stages=stage_map.get(existing_task_row["id"], {})  # or self.fetch_stages(existing_task_row["id"])
                 )
                 raise TaskAlreadyExistsError(existing_task)
+        insert_sql = """
+            INSERT INTO tasks
+                (id, username, title, normalized_title, status, form_json, data_json, results_json, created_at, updated_at)
+            """
+        values = [
+            task_id,
+            username,
+            title,
+            normalized_name,
+            status,
+            self._serialize(form),
+            None,
+            None,
+            now,
+            now,
+        ]
         try:
-            # Insert new task
-            self.db.execute_query(
-                """
-                INSERT INTO tasks
-                    (id, username, title, normalized_title, status, form_json, data_json, results_json, created_at, updated_at)
-                VALUES
-                    (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """,
-                [
-                    task_id,
-                    username,
-                    title,
-                    normalized_name,
-                    status,
-                    self._serialize(form),
-                    None,
-                    None,
-                    now,
-                    now,
-                ],
-            )
+            if check_existing:
+                # Re-check inside the INSERT itself so a concurrent submission from another
+                # worker process cannot slip in between the lookup above and this insert.
+                inserted = self.db.execute_query(
+                    insert_sql
+                    + f"""
+                    SELECT %s, %s, %s, %s, %s, %s, %s, %s, %s, %s FROM DUAL
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM tasks
+                        WHERE normalized_title = %s AND status NOT IN ({TERMINAL_PLACEHOLDERS})
+                    )
+                    """,
+                    [*values, normalized_name, *TERMINAL_STATUSES],
+                )
+                if not inserted:
+                    existing_task = self.get_active_task_by_title(title)
+                    if existing_task:
+                        raise TaskAlreadyExistsError(existing_task)
+                    raise RuntimeError(f"Task {task_id} was not inserted")
+            else:
+                self.db.execute_query(
+                    insert_sql + "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+                    values,
+                )
         except TaskAlreadyExistsError:
             logger.error("TaskAlreadyExistsError")
             raise
@@ -194,6 +213,27 @@ class CreateUpdateTask:  # (StageStore, TasksListDB, DbUtils):
             stages=stage_map.get(task_row["id"], {})  # or self.fetch_stages(task_row["id"])
         )
 
+    def get_task_status(self, task_id: str) -> Optional[str]:
+        """
+        Return only the status column for a task.
+
+        A single-column primary-key lookup, cheap enough for workers to poll between
+        pipeline steps without loading stages or JSON payloads.
+
+        Parameters:
+            task_id (str): The task's unique identifier.
+
+        Returns:
+            str | None: The task status, or `None` if the task does not exist or the query failed.
+        """
+        rows = self.db.fetch_query_safe(
+            "SELECT status FROM tasks WHERE id = %s",
+            [task_id],
+        )
+        if not rows:
+            return None
+        return rows[0]["status"]
+
     def get_active_task_by_title(self, title: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve the most recent active task whose title matches the given title after trimming and casefold normalization.
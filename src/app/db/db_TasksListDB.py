@@ -9,15 +9,28 @@ from .db_class import Database
 
 logger = logging.getLogger("svg_translate")
 
+# Columns needed by listing views; skips the form/data JSON blobs that listings never render.
+LISTING_COLUMNS = (
+    "id",
+    "username",
+    "title",
+    "normalized_title",
+    "status",
+    "main_file",
+    "results_json",
+    "created_at",
+    "updated_at",
+)
+
 
 class TasksListDB:  # (StageStore, DbUtils)
 
     def __init__(self, db : Database | None = None) -> None:
         self.db = db
 
-    def create_base_sql(self, order_column, statuses, status, username, direction, limit, offset):
+    def create_base_sql(self, order_column, statuses, status, username, direction, limit, offset, columns="*"):
 
-        query_parts = ["SELECT * FROM tasks"]
+        query_parts = [f"SELECT {columns} FROM tasks"]
         where_clauses = []
         params: List[Any] = []
 
@@ -62,6 +75,7 @@ class TasksListDB:  # (StageStore, DbUtils)
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         username: Optional[str] = None,
+        include_payloads: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         List tasks from the store with optional filtering, ordering, and pagination.
@@ -73,6 +87,7 @@ class TasksListDB:  # (StageStore, DbUtils)
             descending (bool): If True, sort in descending order; otherwise sort ascending.
             limit (Optional[int]): Maximum number of rows to return.
             offset (Optional[int]): Number of rows to skip before returning results. If `offset` is provided without `limit`, an implementation-wide large limit is applied to allow offsetting.
+            include_payloads (bool): When False, only `LISTING_COLUMNS` are fetched and the returned tasks have `form` and `data` set to None.
 
         Returns:
             List[Dict[str, Any]]: A list of task dictionaries (as produced by `_row_to_task`) matching the query; returns an empty list on query failure.
@@ -82,7 +97,10 @@ class TasksListDB:  # (StageStore, DbUtils)
         order_column = order_by if order_by in allowed_order_columns else "created_at"
         direction = "DESC" if descending else "ASC"
 
-        query_parts, params = self.create_base_sql(order_column, statuses, status, username, direction, limit, offset)
+        columns = "*" if include_payloads else ", ".join(LISTING_COLUMNS)
+        query_parts, params = self.create_base_sql(
+            order_column, statuses, status, username, direction, limit, offset, columns=columns
+        )
 
         base_sql = " ".join(query_parts)
         sql = f"""
@@ -8,6 +8,11 @@ from typing import Any, Iterable, Sequence
 
 import pymysql
 
+try:  # pragma: no cover - optional speed-up
+    from fastrlock.rlock import FastRLock as _RLock
+except ImportError:  # pragma: no cover - fallback when fastrlock is absent
+    _RLock = threading.RLock
+
 
 logger = logging.getLogger("svg_translate")
 
@@ -22,6 +27,12 @@ class Database:
     RETRYABLE_ERROR_CODES = {2006, 2013, 2014, 2017, 2018, 2055}
     MAX_RETRIES = 3
     BASE_BACKOFF = 0.2
+    # Reads skip the ping on a connection used within this window; a connection dropped
+    # sooner surfaces as a retryable error (2006/2013) and the read is simply re-run.
+    # Writes always ping first: a 2013 after the server applied a write would make the
+    # retry loop run the INSERT/UPDATE twice.
+    PING_INTERVAL = 30.0
+    READ_ONLY_PREFIXES = ("select", "show")
 
     def __init__(self, db_data):
         """
@@ -49,8 +60,9 @@ class Database:
         else:
             self.credentials = {'read_default_file': db_data.get("db_connect_file")}
 
-        self._lock = threading.RLock()
+        self._lock = _RLock()
         self.connection: Any | None = None
+        self._last_used = 0.0
 
         try:
             self._connect()
@@ -81,19 +93,28 @@ class Database:
                 cursorclass=pymysql.cursors.DictCursor,
                 **self.credentials
             )
+            self._last_used = time.monotonic()
+
+    def _ensure_connection(self, read_only: bool = False) -> None:
+        """Ensure the current connection is alive, reconnecting as needed.
 
-    def _ensure_connection(self) -> None:
-        """Ensure the current connection is alive, reconnecting as needed."""
+        ``read_only`` statements may skip the ping when the connection was used within
+        ``PING_INTERVAL``; writes are always preceded by one.
+        """
         with self._lock:
             if self.connection is None:
                 self._connect()
                 return
 
+            if read_only and time.monotonic() - self._last_used < self.PING_INTERVAL:
+                return
+
             try:
                 self.connection.ping(reconnect=True)
             except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
                 self._close_connection()
                 self._connect()
+            self._last_used = time.monotonic()
 
     def _close_connection(self) -> None:
         with self._lock:
@@ -161,12 +182,13 @@ class Database:
         params: Any,
         *,
         timeout_override: float | None = None,
+        read_only: bool = False,
     ):
         last_exc: BaseException | None = None
         for attempt in range(1, self.MAX_RETRIES + 1):
             start = time.monotonic()
             try:
-                self._ensure_connection()
+                self._ensure_connection(read_only=read_only)
                 assert self.connection is not None  # for type checkers
                 with self._lock:
                     cursor = self.connection.cursor()
@@ -174,6 +196,7 @@ class Database:
                         if timeout_override is not None:
                             self._set_query_timeout(cursor, timeout_override)
                         result = operation(cursor, sql_query, params)
+                        self._last_used = time.monotonic()
                         return result
                     finally:
                         if timeout_override is not None:
@@ -246,6 +269,7 @@ class Database:
             sql_query,
             params,
             timeout_override=timeout_override,
+            read_only=sql_query.lstrip().lower().startswith(self.READ_ONLY_PREFIXES),
         )
 
     def fetch_query(
@@ -266,6 +290,7 @@ class Database:
             sql_query,
             params,
             timeout_override=timeout_override,
+            read_only=True,
         )
         return list(result or [])
 
@@ -24,10 +24,9 @@ def get_db() -> Database:
     """Return a lazily-instantiated :class:`Database` using ``db_data``."""
     global _db
 
-    if not has_db_config():
-        logger.error("MySQL configuration is not available for the user token store.")
-
     if _db is None:
+        if not has_db_config():
+            logger.error("MySQL configuration is not available for the user token store.")
         _db = Database(settings.db_data)
     return _db
 
@@ -43,7 +43,8 @@ class TaskStorePyMysql(CreateUpdateTask, StageStore, TasksListDB, DbUtils):
         Ensure the tasks table and its indexes exist in the MySQL database.
 
         Creates the tasks table (with text-based JSON columns for broad MySQL compatibility) and
-        ensures indexes on normalized_title, status, and created_at are present. Index creation is
+        ensures indexes on normalized_title, status, created_at, and the composite
+        (normalized_title, status, created_at) duplicate-lookup index are present. Index creation is
         guarded for compatibility with MySQL versions that do not support CREATE INDEX IF NOT EXISTS.
         Logs a warning if schema initialization fails.
         """
@@ -97,6 +98,13 @@ class TaskStorePyMysql(CreateUpdateTask, StageStore, TasksListDB, DbUtils):
         if "idx_tasks_norm" not in existing_idx:
             self.db.execute_query_safe("CREATE INDEX idx_tasks_norm ON tasks(normalized_title)")
         # ---
+        # Covers the active-task duplicate lookup (normalized_title = ? AND status NOT IN (...)
+        # ORDER BY created_at DESC LIMIT 1) without scanning every task for the title.
+        if "idx_tasks_norm_status_created" not in existing_idx:
+            self.db.execute_query_safe(
+                "CREATE INDEX idx_tasks_norm_status_created ON tasks(normalized_title, status, created_at)"
+            )
+        # ---
         if "idx_tasks_status" not in existing_idx:
             self.db.execute_query_safe("CREATE INDEX idx_tasks_status ON tasks(status)")
         # ---
@@ -1,8 +1,20 @@
 
-import json
 import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a title for duplicate detection.
+
+    Returns:
+        normalized (str): The title with surrounding whitespace removed and casefold applied.
+    """
+    title = title.replace("_", " ")
+    return title.strip().casefold()
+
 
 class DbUtils:
     def __init__(self):
@@ -110,11 +122,11 @@ class DbUtils:
             value (Any): The Python value to serialize; if `None`, no serialization is performed.
 
         Returns:
-            Optional[str]: JSON string of `value` with Unicode preserved (`ensure_ascii=False`), or `None` if `value` is `None`.
+            Optional[str]: JSON string of `value` with Unicode preserved, or `None` if `value` is `None`.
         """
         if value is None:
             return None
-        return json.dumps(value, ensure_ascii=False)
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
 
     def _deserialize(self, value: Optional[str]) -> Any:
         """
@@ -128,7 +140,7 @@ class DbUtils:
         """
         if value is None:
             return None
-        return json.loads(value)
+        return orjson.loads(value)
 
     def _current_ts(self) -> str:
         # Store in UTC. MySQL DATETIME has no TZ; keep application-level UTC.
@@ -141,11 +153,5 @@ class DbUtils:
         return datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
     def _normalize_title(self, title: str) -> str:
-        """
-        Normalize a title for duplicate detection.
-
-        Returns:
-            normalized (str): The title with surrounding whitespace removed and casefold applied.
-        """
-        title = title.replace("_", " ")
-        return title.strip().casefold()
+        """Normalize a title for duplicate detection; see :func:`normalize_title`."""
+        return normalize_title(title)
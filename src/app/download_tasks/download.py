@@ -4,24 +4,93 @@ from __future__ import annotations
 
 import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, Iterable, Callable
 from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 from ..db.task_store_pymysql import TaskStorePyMysql
 from ..config import settings
 
 logger = logging.getLogger("svg_translate")
 
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Downloads are network bound; a few concurrent GETs hide latency without hammering Commons.
+DOWNLOAD_WORKERS = 8
+COMMONS_API = "https://commons.wikimedia.org/w/api.php"
+# Titles per imageinfo query; the API limit for regular users.
+IMAGEINFO_BATCH_SIZE = 50
+
+
+def _make_session() -> requests.Session:
+    """Return a keep-alive session that retries throttled and failed Commons requests."""
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": settings.oauth.user_agent,
+    })
+    adapter = HTTPAdapter(
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch_file_urls(titles: list[str], session: requests.Session) -> Dict[str, str | None]:
+    """Resolve direct Commons download URLs with batched ``imageinfo`` queries.
+
+    Parameters:
+        titles (list[str]): File titles without the ``File:`` prefix.
+        session (requests.Session): Session used for the API calls.
+
+    Returns:
+        dict: Maps each resolved title to its ``upload.wikimedia.org`` URL, or to
+        ``None`` when the file does not exist on Commons. Titles from batches that
+        could not be queried are left out so callers fall back to a plain download.
+    """
+    urls: Dict[str, str | None] = {}
+    for start in range(0, len(titles), IMAGEINFO_BATCH_SIZE):
+        requested = {f"File:{title}": title for title in titles[start:start + IMAGEINFO_BATCH_SIZE]}
+        params = {
+            "action": "query",
+            "prop": "imageinfo",
+            "iiprop": "url",
+            "titles": "|".join(requested),
+            "format": "json",
+            "formatversion": "2",
+        }
+        try:
+            response = session.get(COMMONS_API, params=params, timeout=30)
+            response.raise_for_status()
+            query = response.json().get("query") or {}
+        except (requests.RequestException, ValueError, AttributeError) as exc:
+            logger.warning("imageinfo lookup failed for %s titles: %s", len(requested), exc)
+            continue
+
+        aliases = {item["to"]: item["from"] for item in query.get("normalized", [])}
+        for page in query.get("pages", []):
+            page_title = page.get("title", "")
+            title = requested.get(aliases.get(page_title, page_title))
+            if title is None:
+                continue
+            if page.get("missing"):
+                urls[title] = None
+            elif page.get("imageinfo"):
+                urls[title] = page["imageinfo"][0].get("url") or urls.get(title)
+    return urls
+
 
 def download_one_file(
     title: str,
     out_dir: Path,
     i: int,
     session: requests.Session = None,
-    overwrite: bool = False
+    overwrite: bool = False,
+    url: str | None = None,
 ) -> Dict[str, str]:
     """Download a single Commons file, skipping already-downloaded copies.
 
@@ -32,6 +101,8 @@ def download_one_file(
         session (requests.Session | None): Optional shared session. A new session
             with an appropriate User-Agent is created when omitted.
         overwrite (bool): Whether to overwrite existing files.
+        url (str | None): Direct file URL when already known; defaults to the
+            ``Special:FilePath`` redirect for ``title``.
 
     Returns:
         dict: Outcome dictionary with keys ``result`` ("success", "existing", or
@@ -47,7 +118,7 @@ def download_one_file(
     if not title:
         return data
 
-    url = f"{base}{quote(title)}"
+    url = url or f"{base}{quote(title)}"
     out_path = out_dir / title
 
     if out_path.exists() and not overwrite:
@@ -57,26 +128,40 @@ def download_one_file(
         return data
 
     if not session:
-        session = requests.Session()
-        session.headers.update({
-            "User-Agent": settings.oauth.user_agent,
-        })
+        session = _make_session()
     try:
-        response = session.get(url, timeout=30, allow_redirects=True)
+        response = session.get(url, timeout=30, allow_redirects=True, stream=True)
     except requests.RequestException as exc:
         data["result"] = "failed"
         logger.error(f"[{i}] Failed (network error): {title} -> {exc}")
         return data
 
-    if response.status_code == 200:
-        logger.debug(f"[{i}] Downloaded: {title}")
-        out_path.write_bytes(response.content)
-        logger.debug(f"[{i}] out_path: {str(out_path)}")
-        data["result"] = "success"
-        data["path"] = str(out_path)
-    else:
+    if response.status_code != 200:
+        response.close()
         data["result"] = "failed"
         logger.error(f"[{i}] Failed (non-SVG or not found): {title}")
+        return data
+
+    # Stream the body to a temporary sibling and rename it into place, so large files
+    # never sit in memory whole and an interrupted download leaves no partial file.
+    tmp_path = out_path.with_name(f"{out_path.name}.part")
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+        os.replace(tmp_path, out_path)
+    except (requests.RequestException, OSError) as exc:
+        tmp_path.unlink(missing_ok=True)
+        data["result"] = "failed"
+        logger.error(f"[{i}] Failed (interrupted download): {title} -> {exc}")
+        return data
+    finally:
+        response.close()
+
+    logger.debug(f"[{i}] Downloaded: {title}")
+    logger.debug(f"[{i}] out_path: {str(out_path)}")
+    data["result"] = "success"
+    data["path"] = str(out_path)
 
     return data
 
@@ -110,48 +195,83 @@ def download_task(
     out_dir = Path(str(output_dir_main))
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    session = requests.Session()
+    # requests.Session is not guaranteed thread-safe: each worker builds its own on
+    # first use and keeps it for the rest of this call.
+    worker_local = threading.local()
+    sessions: list[requests.Session] = []
 
-    session.headers.update({
-        "User-Agent": settings.oauth.user_agent,
-    })
+    def download_in_worker(title: str, index: int, url: str | None) -> Dict[str, str]:
+        session = getattr(worker_local, "session", None)
+        if session is None:
+            session = worker_local.session = _make_session()
+            sessions.append(session)
+        return download_one_file(title, out_dir, index, session, url=url)
 
     def message_updater(value: str) -> None:
         store.update_stage_column(task_id, "download", "stage_message", value)
 
-    files: list[str] = []
+    # One imageinfo query per 50 missing files replaces a FilePath redirect per file and
+    # tells us which files no longer exist on Commons, so those are never requested.
+    with _make_session() as session:
+        file_urls = fetch_file_urls([t for t in titles if t and not (out_dir / t).exists()], session)
+
+    results: list[Dict[str, str] | None] = [None] * total
 
     done = 0
     not_done = 0
     existing = 0
     not_done_list = []
-    for index, title in enumerate(tqdm(titles, total=len(titles), desc="Downloading files"), 1):
-        result = download_one_file(title, out_dir, index, session)
-        status = result["result"] or "failed"
-        if status == "success":
-            done += 1
-        elif status == "existing":
-            existing += 1
-        else:
+    cancelled = False
+    for index, title in enumerate(titles, 1):
+        if title in file_urls and file_urls[title] is None:
+            logger.error(f"[{index}] Failed (missing on Commons): {title}")
+            results[index - 1] = {"result": "failed", "path": ""}
             not_done += 1
             not_done_list.append(title)
 
-        stages["message"] = f"Downloading {index:,}/{len(titles):,}"
-
-        if result["path"]:
-            files.append(str(result["path"]))
+    # Fetch in parallel; counters and cancellation are handled here as downloads finish.
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="download") as pool:
+        futures = {
+            pool.submit(download_in_worker, title, index, file_urls.get(title)): index
+            for index, title in enumerate(titles, 1)
+            if results[index - 1] is None
+        }
+        progress = tqdm(as_completed(futures), total=len(futures), desc="Downloading files")
+        for processed, future in enumerate(progress, 1):
+            index = futures[future]
+            result = future.result()
+            results[index - 1] = result
+            status = result["result"] or "failed"
+            if status == "success":
+                done += 1
+            elif status == "existing":
+                existing += 1
+            else:
+                not_done += 1
+                not_done_list.append(titles[index - 1])
+
+            if processed % 10 == 0:
+                if check_cancel and check_cancel("download"):
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    cancelled = True
+                    break
+
+    for session in sessions:
+        session.close()
+
+    stages["message"] = (
+        f"Total Files: {total:,}, "
+        f"Downloaded {done:,}, "
+        f"skip existing {existing:,}, "
+        f"failed to download: {not_done:,}"
+    )
+    message_updater(stages["message"])
 
-        stages["message"] = (
-            f"Total Files: {total:,}, "
-            f"Downloaded {done:,}, "
-            f"skip existing {existing:,}, "
-            f"failed to download: {not_done:,}"
-        )
-        message_updater(stages["message"])
+    # Keep the submitted title order regardless of completion order.
+    files: list[str] = [str(result["path"]) for result in results if result and result["path"]]
 
-        if index % 10 == 0:
-            if check_cancel and check_cancel("download"):
-                return files, stages, not_done_list
+    if cancelled:
+        return files, stages, not_done_list
 
     logger.debug("files: %s", len(files))
 
@@ -169,9 +289,9 @@ def download_task(
 
 def download_commons_svgs(titles, files_dir):
     files = []
+    session = _make_session() if titles else None
     for n, title in enumerate(titles, 1):
-        # download_one_file(title: str, out_dir: Path, i: int, session: requests.Session = None)
-        file = download_one_file(title, files_dir, n)
+        file = download_one_file(title, files_dir, n, session)
         if file.get("path"):
             files.append(file["path"])
     return files
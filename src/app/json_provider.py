@@ -0,0 +1,47 @@
+"""orjson-backed JSON provider for Flask responses."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Dates and datetimes go through ``default`` so they keep Flask's HTTP-date format.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+# The keyword sets Flask's own ``response()`` passes to ``dumps``.
+_COMPACT_KWARGS = {"separators": (",", ":")}
+_INDENT_KWARGS = {"indent": 2}
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize ``jsonify`` payloads with orjson.
+
+    Output matches :class:`DefaultJSONProvider` (``sort_keys`` is honoured and dates use
+    :func:`~werkzeug.http.http_date`), except that non-ASCII text is written as UTF-8
+    instead of ``\\uXXXX`` escapes; ``ensure_ascii`` is not applied. Other keyword
+    arguments meant for :func:`json.dumps` / :func:`json.loads` (``cls``,
+    ``object_hook`` ...) fall back to the stdlib implementation so explicit callers
+    keep working.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = _ORJSON_OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs == _INDENT_KWARGS:
+            option |= orjson.OPT_INDENT_2
+        elif kwargs and kwargs != _COMPACT_KWARGS:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+__all__ = [
+    "OrjsonProvider",
+]
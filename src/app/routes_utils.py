@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 import logging
 from typing import Any, Dict, List
 
@@ -25,17 +26,17 @@ def load_auth_payload(user: Any | None):
     return auth_payload
 
 
+ERROR_MESSAGES = {
+    "task-active": "A task for this title is already in progress.",
+    "not-found": "Task not found.",
+    "task-create-failed": "Task creation failed.",
+}
+
+
 def get_error_message(error_code: str | None) -> str:
     if not error_code:
         return ""
-    # ---
-    messages = {
-        "task-active": "A task for this title is already in progress.",
-        "not-found": "Task not found.",
-        "task-create-failed": "Task creation failed.",
-    }
-    # ---
-    return messages.get(error_code, error_code)
+    return ERROR_MESSAGES.get(error_code, error_code)
 
 
 def _format_timestamp(value: datetime | str | None) -> tuple[str, str]:
@@ -52,30 +53,27 @@ def _format_timestamp(value: datetime | str | None) -> tuple[str, str]:
     """
     if not value:
         return "", ""
+    if not isinstance(value, (datetime, str)):
+        return str(value), str(value)
+    return _format_timestamp_cached(value)
 
-    dt = None
 
-    if isinstance(value, datetime):
-        dt = value
-    elif isinstance(value, str):
+@lru_cache(maxsize=8192)
+def _format_timestamp_cached(value: datetime | str) -> tuple[str, str]:
+    # A task listing repeats the same created/updated values across renders, so each
+    # distinct value is parsed and formatted once.
+    dt = value
+    if isinstance(value, str):
         try:
-            # First, try parsing as an ISO 8601 format string.
+            # fromisoformat also accepts the "%Y-%m-%d %H:%M:%S" form (space separator, 3.7+).
             dt = datetime.fromisoformat(value)
-        except (TypeError, ValueError):
+        except ValueError:
             try:
-                # If that fails, try the specific "%Y-%m-%d %H:%M:%S" format.
                 dt = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
-            except (TypeError, ValueError):
-                # If both fail, dt remains None.
-                pass
-
-    if not dt:
-        return str(value), str(value)
-
-    display = dt.strftime("%Y-%m-%d %H:%M:%S")
-    sort_key = dt.isoformat()
+            except ValueError:
+                return value, value
 
-    return display, sort_key
+    return dt.strftime("%Y-%m-%d %H:%M:%S"), dt.isoformat()
 
 
 def order_stages(stages: Dict[str, Any] | None) -> List[tuple[str, Dict[str, Any]]]:
@@ -86,7 +84,11 @@ def order_stages(stages: Dict[str, Any] | None) -> List[tuple[str, Dict[str, Any
         for name, data in stages.items()
         if isinstance(data, dict)
     ]
-    ordered.sort(key=lambda item: item[1].get("number", 0))
+    # Stage maps read from the database are already built in stage_number order, so
+    # only fall back to sorting for maps assembled some other way.
+    numbers = [data.get("number") or 0 for _, data in ordered]
+    if any(a > b for a, b in zip(numbers, numbers[1:])):
+        ordered.sort(key=lambda item: item[1].get("number") or 0)
     return ordered
 
 
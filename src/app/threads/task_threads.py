@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
+import os
 import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
 from ..config import settings
-from .web_run_task import run_task
+from ..db.utils import normalize_title
 
 CANCEL_EVENTS: Dict[str, threading.Event] = {}
 CANCEL_EVENTS_LOCK = threading.Lock()
-# The use of a global dictionary CANCEL_EVENTS with a threading.Lock ties the cancellation mechanism to a single-process, multi-threaded server model. This approach will not work correctly in a multi-process environment (e.g., when using Gunicorn with multiple worker processes), as each process would have its own independent copy of CANCEL_EVENTS. For a more scalable and robust solution, consider using a shared external store like Redis or a database to manage cancellation state across processes.
+# Events only reach runners in this process; runners also poll the task status in the
+# database (see ``run_task.check_cancel``) so cancels handled by other workers apply too.
+
+# Normalized title -> id of the task running for it in this process. Lets /start turn
+# away an obvious resubmission without a query; the database stays the source of truth.
+ACTIVE_TITLES: Dict[str, str] = {}
+ACTIVE_TITLES_LOCK = threading.Lock()
+
+# Bounded pool shared by all task submissions; extra tasks queue instead of each
+# POST spawning its own thread.
+TASK_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+TASK_EXECUTOR = ThreadPoolExecutor(max_workers=TASK_WORKERS, thread_name_prefix="task-runner")
+# Running plus queued tasks accepted by this process; submissions beyond it are refused
+# so a burst cannot build an unbounded backlog.
+MAX_PENDING_TASKS = TASK_WORKERS * 4
+_TASK_SLOTS = threading.BoundedSemaphore(MAX_PENDING_TASKS)
 
 logger = logging.getLogger("svg_translate")
 
@@ -31,37 +48,81 @@ def get_cancel_event(task_id: str) -> threading.Event | None:
         return CANCEL_EVENTS.get(task_id)
 
 
-def launch_task_thread(
+def _register_active_title(title: str, task_id: str) -> None:
+    with ACTIVE_TITLES_LOCK:
+        ACTIVE_TITLES[normalize_title(title)] = task_id
+
+
+def release_active_title(title: str, task_id: str) -> None:
+    """Forget ``task_id`` as the active task for ``title`` if it still holds the entry."""
+    key = normalize_title(title)
+    with ACTIVE_TITLES_LOCK:
+        if ACTIVE_TITLES.get(key) == task_id:
+            del ACTIVE_TITLES[key]
+
+
+def get_active_task_id(title: str) -> str | None:
+    """Return the id of the task this process is running for ``title``, if any."""
+    with ACTIVE_TITLES_LOCK:
+        return ACTIVE_TITLES.get(normalize_title(title))
+
+
+def _run_task_job(
     task_id: str,
     title: str,
     args: Any,
     user_payload: Dict[str, Any],
+    cancel_event: threading.Event | None = None,
 ) -> None:
+    """Run one task end to end; a plain module-level callable so any executor can take it."""
+    # The translation pipeline (lxml, mwclient, the bots) is only loaded once a task runs.
+    from .web_run_task import run_task
+
+    try:
+        run_task(
+            settings.db_data,
+            task_id,
+            title,
+            args,
+            user_payload,
+            cancel_event=cancel_event,
+        )
+    except Exception:
+        # Executor futures swallow exceptions, so log them like a dying thread would.
+        logger.exception("Task %s crashed", task_id)
+    finally:
+        _pop_cancel_event(task_id)
+        release_active_title(title, task_id)
+        _TASK_SLOTS.release()
+
+
+def launch_task_thread(
+    task_id: str,
+    title: str,
+    args: Any,
+    user_payload: Dict[str, Any],
+) -> bool:
+    """Queue ``task_id`` for execution; return False when ``MAX_PENDING_TASKS`` is reached."""
+    if not _TASK_SLOTS.acquire(blocking=False):
+        logger.warning("Task queue full, refusing task %s", task_id)
+        return False
     cancel_event = threading.Event()
     _register_cancel_event(task_id, cancel_event)
-
-    def _runner() -> None:
-        try:
-            run_task(
-                settings.db_data,
-                task_id,
-                title,
-                args,
-                user_payload,
-                cancel_event=cancel_event,
-            )
-        finally:
-            _pop_cancel_event(task_id)
-
-    t = threading.Thread(
-        target=_runner,
-        name=f"task-runner-{task_id[:8]}",
-        daemon=True,
-    )
-    t.start()
+    _register_active_title(title, task_id)
+    try:
+        TASK_EXECUTOR.submit(_run_task_job, task_id, title, args, user_payload, cancel_event)
+    except BaseException:
+        # e.g. RuntimeError after executor shutdown: undo the registration or it leaks.
+        _pop_cancel_event(task_id)
+        release_active_title(title, task_id)
+        _TASK_SLOTS.release()
+        raise
+    return True
 
 
 __all__ = [
+    "get_active_task_id",
     "get_cancel_event",
     "launch_task_thread",
+    "release_active_title",
 ]
@@ -0,0 +1,42 @@
+"""Striped locks that serialize task creation per normalized title."""
+
+from __future__ import annotations
+
+import threading
+from typing import List
+
+from ..db.utils import normalize_title
+
+
+class StripedLock:
+    """A fixed set of locks selected by hashing a key.
+
+    Requests for different titles usually land on different shards and no
+    longer wait on each other, while two submissions of the same title always
+    share a lock so the duplicate check and insert stay atomic per process.
+    """
+
+    def __init__(self, shards: int = 16) -> None:
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError("shards must be a positive power of two")
+        self._mask = shards - 1
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(shards)]
+
+    def for_key(self, key: str) -> threading.Lock:
+        """Return the lock guarding ``key``."""
+        return self._locks[hash(key) & self._mask]
+
+
+TITLE_LOCKS = StripedLock()
+
+
+def title_lock(title: str) -> threading.Lock:
+    """Return the shard lock for ``title`` after duplicate-check normalization."""
+    return TITLE_LOCKS.for_key(normalize_title(title))
+
+
+__all__ = [
+    "StripedLock",
+    "TITLE_LOCKS",
+    "title_lock",
+]
@@ -2,6 +2,7 @@
 import re
 import logging
 import threading
+import time
 from pathlib import Path
 from typing import Any, Dict
 
@@ -21,6 +22,12 @@ from ..db.task_store_pymysql import TaskStorePyMysql
 
 logger = logging.getLogger("svg_translate")
 
+_UNSAFE_SLUG_CHARS = re.compile(r'[^A-Za-z0-9._\- ]+')
+
+# Minimum seconds between stored-status polls in ``check_cancel``; it runs once per
+# file in the download/upload loops, so polling every call would hit the DB per file.
+CANCEL_POLL_INTERVAL = 5.0
+
 
 def _compute_output_dir(title: str) -> Path:
     """Return the filesystem directory used to store intermediate task output.
@@ -41,7 +48,7 @@ def _compute_output_dir(title: str) -> Path:
     logger.debug(f"compute_output_dir: {name=}")
     # ---
     # name = death rate from obesity
-    slug = re.sub(r'[^A-Za-z0-9._\- ]+', "_", str(name)).strip("._") or "untitled"
+    slug = _UNSAFE_SLUG_CHARS.sub("_", str(name)).strip("._") or "untitled"
     slug = slug.replace(" ", "_").lower()
     # ---
     out = Path(settings.paths.svg_data) / slug
@@ -184,9 +191,22 @@ def run_task(
 
         store.update_data(task_id, task_snapshot)
 
+        if cancel_event is None:
+            cancel_event = threading.Event()
+        last_status_poll = float("-inf")
+
         def check_cancel(stage_name: str | None = None) -> bool:
-            if cancel_event is None or not cancel_event.is_set():
-                return False
+            # The in-process event covers cancels handled by this worker; the stored
+            # status covers cancels received by any other worker process.
+            nonlocal last_status_poll
+            if not cancel_event.is_set():
+                now = time.monotonic()
+                if now - last_status_poll < CANCEL_POLL_INTERVAL:
+                    return False
+                last_status_poll = now
+                if store.get_task_status(task_id) != "Cancelled":
+                    return False
+                cancel_event.set()
 
             if stage_name:
                 stage_state = stages_list.get(stage_name)
@@ -200,7 +220,7 @@ def run_task(
             logger.debug(f"Task: {task_id} Cancelled.")
             return True
 
-        if cancel_event is not None and cancel_event.is_set():
+        if cancel_event.is_set():
             if check_cancel("initialize"):
                 return
 
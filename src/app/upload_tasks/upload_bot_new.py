@@ -35,7 +35,6 @@ def upload_file(file_name, file_path, site: Site=None, summary=None):
         with open(file_path, 'rb') as f:
             # Perform the upload
             response = site.upload(
-                # file=(os.path.basename(file_path), file_content, 'image/svg+xml'),
                 file=f,
                 filename=file_name,
                 comment=summary or "",
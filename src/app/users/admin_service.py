@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import List
+import threading
+from typing import FrozenSet, List
+
+from cachetools import TTLCache
 
 from ..config import settings
 from ..db import has_db_config
@@ -13,6 +16,12 @@ logger = logging.getLogger("svg_translate")
 
 _ADMINS_STORE: CoordinatorsDB | None = None
 
+# Admin checks run on every page render; reread the coordinator table at most this often.
+# Writes made through this module clear the cache, other workers catch up within the TTL.
+ACTIVE_COORDINATORS_TTL = 30
+_active_cache: TTLCache = TTLCache(maxsize=1, ttl=ACTIVE_COORDINATORS_TTL)
+_active_cache_lock = threading.Lock()
+
 
 def get_admins_db() -> CoordinatorsDB:
     global _ADMINS_STORE
@@ -32,12 +41,24 @@ def get_admins_db() -> CoordinatorsDB:
     return _ADMINS_STORE
 
 
-def active_coordinators() -> list:
-    """Return all coordinators while keeping settings.admins in sync."""
+def active_coordinators() -> FrozenSet[str]:
+    """Return the usernames of active coordinators, cached for ``ACTIVE_COORDINATORS_TTL``."""
+
+    with _active_cache_lock:
+        cached = _active_cache.get("active")
+    if cached is not None:
+        return cached
 
     store = get_admins_db()
+    active = frozenset(u.username for u in store.list() if u.is_active)
+    with _active_cache_lock:
+        _active_cache["active"] = active
+    return active
+
 
-    return [u.username for u in store.list() if u.is_active]
+def _invalidate_active_coordinators() -> None:
+    with _active_cache_lock:
+        _active_cache.clear()
 
 
 def list_coordinators() -> List[CoordinatorRecord]:
@@ -54,6 +75,7 @@ def add_coordinator(username: str) -> CoordinatorRecord:
 
     store = get_admins_db()
     record = store.add(username)
+    _invalidate_active_coordinators()
 
     return record
 
@@ -63,6 +85,7 @@ def set_coordinator_active(coordinator_id: int, is_active: bool) -> CoordinatorR
 
     store = get_admins_db()
     record = store.set_active(coordinator_id, is_active)
+    _invalidate_active_coordinators()
 
     return record
 
@@ -72,6 +95,7 @@ def delete_coordinator(coordinator_id: int) -> CoordinatorRecord:
 
     store = get_admins_db()
     record = store.delete(coordinator_id)
+    _invalidate_active_coordinators()
 
     return record
 
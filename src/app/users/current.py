@@ -54,6 +54,16 @@ def current_user() -> Optional[UserTokenRecord]:
     return user
 
 
+def user_is_admin(user: Optional[UserTokenRecord]) -> bool:
+    """Return whether ``user`` is an active coordinator, evaluated once per request."""
+    if user is None:
+        return False
+    is_admin = g.get("_is_admin")
+    if is_admin is None:
+        is_admin = g._is_admin = user.username in active_coordinators()  # type: ignore[attr-defined]
+    return is_admin
+
+
 def oauth_required(func: F) -> F:
     """Decorator that requires a full OAuth credential bundle."""
 
@@ -72,6 +82,6 @@ def context_user() -> dict[str, Any]:
     return {
         "current_user": user,
         "is_authenticated": user is not None,
-        "is_admin": bool(user and user.username in active_coordinators()),
+        "is_admin": user_is_admin(user),
         "username": user.username if user else None,
     }
@@ -2,7 +2,7 @@
 import requests
 import logging
 import urllib.parse
-from ...config import settings
+from .session import get_session
 
 logger = logging.getLogger("svg_translate")
 
@@ -21,10 +21,7 @@ def get_category_members_api(category, project, limit=500):
     """
 
     api_url = f"https://{project}/w/api.php"
-    session = requests.Session()
-    session.headers.update({
-        "User-Agent": settings.oauth.user_agent
-    })
+    session = get_session()
 
     params = {
         "action": "query",
@@ -79,11 +76,9 @@ def get_category_members_petscan(category, project, limit=500):
 
     logger.debug(f"petscan url: {url}")
 
-    headers = {}
-    headers["User-Agent"] = settings.oauth.user_agent
     text = ""
     try:
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = get_session().get(url, timeout=30)
         resp.raise_for_status()
         text = resp.text
     except Exception as e:
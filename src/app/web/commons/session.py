@@ -0,0 +1,35 @@
+"""Shared HTTP session for read-only Commons API helpers."""
+
+from __future__ import annotations
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ...config import settings
+
+_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    """Return this thread's pooled session, creating it on first use.
+
+    ``requests.Session`` is not guaranteed thread-safe, so each request or task
+    thread keeps its own session and reuses its keep-alive connections across calls.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update({
+            "User-Agent": settings.oauth.user_agent
+        })
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        session.mount("https://", adapter)
+        _local.session = session
+    return session
+
+
+__all__ = [
+    "get_session",
+]
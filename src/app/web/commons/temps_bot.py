@@ -1,34 +1,52 @@
 """
 
 read temp.txt
-get main title from {{SVGLanguages|parkinsons-disease-prevalence-ihme,World,1990.svg}} using wtp
+get main title from {{SVGLanguages|parkinsons-disease-prevalence-ihme,World,1990.svg}}
 get all files names from owidslidersrcs
 
+Only two templates are needed, so they are located with precompiled regexes and
+brace matching instead of building a full wikitext parse tree.
+
 """
 
-import wikitextparser as wtp
 import re
 
+_TRANSLATE_LINE = re.compile(
+    r"^\*'''Translate''':\s+https?://svgtranslate\.toolforge\.org/(File:[\w\-,.()]+\.svg)$",
+    flags=re.MULTILINE,
+)
+# First positional argument of {{SVGLanguages|...}}; group(1) is None for {{SVGLanguages}}.
+_SVGLANGUAGES = re.compile(
+    r"\{\{\s*SVGLanguages\s*(?:\|(?:\s*1\s*=)?([^|}]*)|\}\})",
+    flags=re.IGNORECASE,
+)
+_OWIDSLIDERSRCS = re.compile(r"\{\{\s*owidslidersrcs\s*(?=[|}])", flags=re.IGNORECASE)
+_TEMPLATE_BRACES = re.compile(r"\{\{|\}\}")
+_SVG_FILE = re.compile(r"File:([^\n|!]+\.svg)")
+
+
+def _template_blocks(text, start_pattern):
+    """Yield the full source of every closed template whose opening matches ``start_pattern``."""
+    for start in start_pattern.finditer(text):
+        depth = 0
+        for brace in _TEMPLATE_BRACES.finditer(text, start.start()):
+            depth += 1 if brace.group() == "{{" else -1
+            if depth == 0:
+                yield text[start.start():brace.end()]
+                break
+
 
 def match_main_title(text):
     # Match lines starting with *'''Translate''': followed by a URL
-    pattern = r"^\*'''Translate''':\s+https?://svgtranslate\.toolforge\.org/(File:[\w\-,.()]+\.svg)$"
-    match = re.search(pattern, text, flags=re.MULTILINE)
+    match = _TRANSLATE_LINE.search(text)
     return match.group(1) if match else None
 
 
 def find_main_title(text):
 
-    # Parse the text using wikitextparser
-    parsed = wtp.parse(text)
-
     # --- 1. Extract main title from {{SVGLanguages|...}}
-    main_title = None
-    for tpl in parsed.templates:
-        if tpl.name.strip().lower() == "svglanguages":
-            if tpl.arguments:
-                main_title = tpl.arguments[0].value.strip()
-            break
+    match = _SVGLANGUAGES.search(text)
+    main_title = match.group(1).strip() if match and match.group(1) else None
 
     if main_title:
         main_title = main_title.replace("_", " ").strip()
@@ -42,16 +60,11 @@ def get_titles(text):
       - all file names from {{owidslidersrcs}}
     Returns: titles
     """
-    # Parse the text using wikitextparser
-    parsed = wtp.parse(text)
-
     # --- Extract all file names from {{owidslidersrcs|...}}
     titles = []
-    for tpl in parsed.templates:
-        if tpl.name.strip().lower() == "owidslidersrcs":
-            # Find all filenames inside this template
-            matches = re.findall(r"File:([^\n|!]+\.svg)", tpl.string)
-            titles.extend(m.strip() for m in matches)
+    for block in _template_blocks(text, _OWIDSLIDERSRCS):
+        # Find all filenames inside this template
+        titles.extend(m.strip() for m in _SVG_FILE.findall(block))
 
     return titles
 
@@ -1,11 +1,19 @@
 
-import requests
 import logging
+import threading
 
-from ...config import settings
+from cachetools import TTLCache
+
+from .session import get_session
 
 logger = logging.getLogger("svg_translate")
 
+# Template pages change rarely; repeated runs of the same template within a few
+# minutes reuse the fetched text. Misses (None) are never cached.
+WIKITEXT_TTL = 300
+_wikitext_cache: TTLCache = TTLCache(maxsize=256, ttl=WIKITEXT_TTL)
+_wikitext_lock = threading.Lock()
+
 
 def get_wikitext(title, project="commons.wikimedia.org"):
     """
@@ -16,11 +24,23 @@ def get_wikitext(title, project="commons.wikimedia.org"):
     Returns:
         str: wikitext content or None if not found
     """
+    key = (title, project)
+    with _wikitext_lock:
+        text = _wikitext_cache.get(key)
+    if text is not None:
+        return text
+
+    text = _fetch_wikitext(title, project)
+    if text is not None:
+        with _wikitext_lock:
+            _wikitext_cache[key] = text
+    return text
+
+
+def _fetch_wikitext(title, project):
+    """Query the API for the latest revision text of ``title``; None when missing."""
     api_url = f"https://{project}/w/api.php"
-    session = requests.Session()
-    session.headers.update({
-        "User-Agent": settings.oauth.user_agent
-    })
+    session = get_session()
 
     params = {
         "action": "query",
@@ -142,6 +142,10 @@ def titles_task(stages, text, manual_main_title, titles_limit=None):
 
     main_title, titles = get_files(text)
 
+    # Galleries repeat files across blocks; keep the first occurrence of each so the
+    # download, inject and upload stages never process the same file twice.
+    titles = list(dict.fromkeys(titles))
+
     if manual_main_title:
         main_title = manual_main_title
 
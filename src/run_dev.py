@@ -0,0 +1,39 @@
+"""Local development runner for SVG Translate.
+
+Production loads the WSGI ``app`` from ``app.py``; this script is only run by hand:
+
+    python run_dev.py [debug]   # Flask development server
+    python run_dev.py asgi      # uvicorn via the ASGI wrapper
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from svg_config import _env_file_path  # noqa: F401 # Triggers environment configuration
+
+from log import config_console_logger   # noqa: E402
+from app import create_app              # noqa: E402
+
+
+def main(argv: list[str]) -> None:
+    config_console_logger()
+
+    if "asgi" in argv:
+        import uvicorn
+
+        # "auto" picks uvloop and httptools when installed (uvicorn[standard]) and
+        # falls back to asyncio and h11 otherwise.
+        uvicorn.run(
+            "app:create_asgi_app",
+            factory=True,
+            loop="auto",
+            http="auto",
+            workers=os.cpu_count(),
+        )
+    else:
+        create_app().run(debug="debug" in argv)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -146,9 +146,20 @@ function result_html(r) {
     }
     updateControls(initialStatus);
 
+    function stopPolling() {
+        if (timer) {
+            clearInterval(timer);
+            timer = null;
+        }
+    }
+
     async function refresh() {
+        if (document.hidden) {
+            return;
+        }
         try {
-            const res = await fetch(`/status/${taskId}`, { cache: "no-store" });
+            // "no-cache" revalidates with the ETag, so unchanged polls come back as 304s.
+            const res = await fetch(`/status/${taskId}`, { cache: "no-cache" });
             const taskData = await res.json();
             if (!res.ok) {
                 if (taskData?.error === 'not-found') {
@@ -162,9 +173,7 @@ function result_html(r) {
                         restartBtn.classList.add('d-none');
                     }
                     showAlert('danger', 'Task not found.');
-                    if (timer) {
-                        clearInterval(timer);
-                    }
+                    stopPolling();
                 }
                 return;
             }
@@ -192,9 +201,7 @@ function result_html(r) {
             updateControls(taskData.status);
 
             if (taskData.status && STOP_STATUSES.has(taskData.status)) {
-                if (timer) {
-                    clearInterval(timer);
-                }
+                stopPolling();
             }
 
             if (lastUpdate) {
@@ -208,15 +215,21 @@ function result_html(r) {
     timer = setInterval(refresh, 2000);
     refresh();
 
+    // Polls are skipped while the tab is hidden; catch up as soon as it is shown again,
+    // unless polling has stopped (finished task, cancel or restart in flight).
+    document.addEventListener('visibilitychange', () => {
+        if (!document.hidden && timer) {
+            refresh();
+        }
+    });
+
     if (cancelBtn) {
         cancelBtn.addEventListener('click', async (event) => {
             event.preventDefault();
             if (cancelBtn.disabled) {
                 return;
             }
-            if (timer) {
-                clearInterval(timer);
-            }
+            stopPolling();
             cancelBtn.disabled = true;
             showAlert('info', 'Stopping task...');
             let message = 'Unable to cancel the task.';
@@ -255,7 +268,7 @@ function result_html(r) {
             if (restartBtn.disabled) {
                 return;
             }
-            if (timer) clearInterval(timer);
+            stopPolling();
 
             restartBtn.disabled = true;
             showAlert('info', 'Restarting task...');
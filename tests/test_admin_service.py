@@ -0,0 +1,36 @@
+from src.app.db.db_CoordinatorsDB import CoordinatorRecord
+from src.app.users import admin_service
+
+
+class FakeCoordinatorsDB:
+    def __init__(self) -> None:
+        self.records = [
+            CoordinatorRecord(id=1, username="Alice", is_active=True),
+            CoordinatorRecord(id=2, username="Bob", is_active=False),
+        ]
+        self.list_calls = 0
+
+    def list(self):
+        self.list_calls += 1
+        return list(self.records)
+
+    def add(self, username: str) -> CoordinatorRecord:
+        record = CoordinatorRecord(id=len(self.records) + 1, username=username, is_active=True)
+        self.records.append(record)
+        return record
+
+
+def test_active_coordinators_cached_until_changed(monkeypatch):
+    store = FakeCoordinatorsDB()
+    monkeypatch.setattr(admin_service, "get_admins_db", lambda: store)
+    admin_service._invalidate_active_coordinators()
+
+    assert admin_service.active_coordinators() == frozenset({"Alice"})
+    assert admin_service.active_coordinators() == frozenset({"Alice"})
+    assert store.list_calls == 1
+
+    admin_service.add_coordinator("Carol")
+    assert admin_service.active_coordinators() == frozenset({"Alice", "Carol"})
+    assert store.list_calls == 2
+
+    admin_service._invalidate_active_coordinators()
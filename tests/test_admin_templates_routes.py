@@ -88,9 +88,6 @@ def admin_templates_client(monkeypatch: pytest.MonkeyPatch):
         "src.app.app_routes.admin.admin_routes.templates.current_user", fake_current_user
     )
     monkeypatch.setattr("src.app.app_routes.admin.admin_required.current_user", fake_current_user)
-    monkeypatch.setattr(
-        "src.app.app_routes.admin.admin_required.active_coordinators", lambda: {admin_user.username}
-    )
     monkeypatch.setattr(
         "src.app.users.admin_service.active_coordinators", lambda: {admin_user.username}
     )
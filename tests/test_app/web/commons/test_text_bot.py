@@ -0,0 +1,22 @@
+"""Unit tests for the cached wikitext fetcher."""
+
+from src.app.web.commons import text_bot
+
+
+def test_get_wikitext_caches_hits_but_not_misses(monkeypatch):
+    calls = []
+
+    def fake_fetch(title, project):
+        calls.append(title)
+        return None if title == "Missing" else f"text of {title}"
+
+    monkeypatch.setattr(text_bot, "_fetch_wikitext", fake_fetch)
+    text_bot._wikitext_cache.clear()
+
+    assert text_bot.get_wikitext("Template:A") == "text of Template:A"
+    assert text_bot.get_wikitext("Template:A") == "text of Template:A"
+    assert text_bot.get_wikitext("Missing") is None
+    assert text_bot.get_wikitext("Missing") is None
+
+    assert calls == ["Template:A", "Missing", "Missing"]
+    text_bot._wikitext_cache.clear()
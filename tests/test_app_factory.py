@@ -29,3 +29,27 @@ def test_create_app_does_not_touch_mysql_when_unconfigured(monkeypatch):
     app = app_module.create_app()
 
     assert app is not None
+
+
+def test_missing_file_gets_plain_404():
+    from src.app import create_app
+
+    app = create_app()
+    client = app.test_client()
+
+    response = client.get("/wp-login.php")
+    assert response.status_code == 404
+    assert response.mimetype == "text/plain"
+    assert response.data == b"Not Found"
+
+    asset = client.get("/static/no-such.css")
+    assert asset.status_code == 404
+    assert asset.mimetype == "text/plain"
+
+    page = client.get("/no-such-page")
+    assert page.status_code == 404
+    assert page.mimetype == "text/html"
+
+    dotted = client.get("/no-such-page/foo.v2")
+    assert dotted.status_code == 404
+    assert dotted.mimetype == "text/html"
@@ -40,3 +40,20 @@ def test_parse_args_empty_manual_main_title(monkeypatch):
     form = MultiDict([])
     parsed = args_utils.parse_args(form)
     assert parsed.manual_main_title is None
+
+
+def test_form_snapshot_keeps_only_task_fields():
+    form = MultiDict(
+        [
+            ("title", "Template:OWID/example"),
+            ("titles_limit", "5"),
+            ("upload", "1"),
+            ("csrf_token", "secret"),
+            ("extra", "x"),
+        ]
+    )
+    assert args_utils.form_snapshot(form) == {
+        "title": "Template:OWID/example",
+        "titles_limit": "5",
+        "upload": "1",
+    }
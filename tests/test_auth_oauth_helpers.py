@@ -1,4 +1,5 @@
 """Unit tests for OAuth helper functions using a stubbed mwoauth."""
+import threading
 from types import SimpleNamespace
 
 import pytest
@@ -36,6 +37,15 @@ class StubMWOAuth(SimpleNamespace):
         super().__init__(ConsumerToken=StubConsumerToken, Handshaker=StubHandshaker)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_handshaker():
+    oauth_helpers.get_handshaker.cache_clear()
+    oauth_helpers._exchanges.clear()
+    yield
+    oauth_helpers.get_handshaker.cache_clear()
+    oauth_helpers._exchanges.clear()
+
+
 def test_start_login_returns_redirect_and_request_token(monkeypatch):
     monkeypatch.setattr(oauth_helpers, "mwoauth", StubMWOAuth())
     app = create_app()
@@ -66,3 +76,79 @@ def test_complete_login_raises_identity_error(monkeypatch):
     monkeypatch.setattr(oauth_helpers, "mwoauth", FailingMWOAuth())
     with pytest.raises(oauth_helpers.OAuthIdentityError):
         oauth_helpers.complete_login(("rk", "rs"), "x=1")
+
+
+def test_get_handshaker_is_reused(monkeypatch):
+    monkeypatch.setattr(oauth_helpers, "mwoauth", StubMWOAuth())
+    assert oauth_helpers.get_handshaker() is oauth_helpers.get_handshaker()
+
+
+def _blocking_mwoauth(exchanges, started, release):
+    class BlockingHandshaker(StubHandshaker):
+        def complete(self, request_token, query_string):
+            exchanges.append(query_string)
+            started.set()
+            release.wait(5)
+            return super().complete(request_token, query_string)
+
+    class BlockingMWOAuth(StubMWOAuth):
+        def __init__(self):
+            super().__init__()
+            self.Handshaker = BlockingHandshaker
+
+    return BlockingMWOAuth()
+
+
+def test_complete_login_shares_in_flight_exchange(monkeypatch):
+    exchanges = []
+    started = threading.Event()
+    release = threading.Event()
+    monkeypatch.setattr(oauth_helpers, "mwoauth", _blocking_mwoauth(exchanges, started, release))
+    waiting = threading.Event()
+
+    class TrackingFuture(oauth_helpers.Future):
+        def result(self, timeout=None):
+            waiting.set()
+            return super().result(timeout)
+
+    monkeypatch.setattr(oauth_helpers, "Future", TrackingFuture)
+    request_token = SimpleNamespace(key="rk", secret="rs")
+    query = "oauth_verifier=v1&oauth_token=rk"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(oauth_helpers.complete_login(request_token, query)))
+    leader.start()
+    assert started.wait(5)
+    future = oauth_helpers._exchanges[("rk", "v1")]
+    follower = threading.Thread(target=lambda: results.append(oauth_helpers.complete_login(request_token, query)))
+    follower.start()
+    assert waiting.wait(5)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert future.done()
+    assert len(results) == 2 and results[0] == results[1]
+    assert exchanges == [query]
+    # The finished exchange (and its access token) is not kept around.
+    assert oauth_helpers._exchanges == {}
+
+
+def test_complete_login_follower_timeout_is_identity_error(monkeypatch):
+    exchanges = []
+    started = threading.Event()
+    release = threading.Event()
+    monkeypatch.setattr(oauth_helpers, "mwoauth", _blocking_mwoauth(exchanges, started, release))
+    monkeypatch.setattr(oauth_helpers, "TOKEN_EXCHANGE_WAIT", 0.05)
+    request_token = SimpleNamespace(key="rk", secret="rs")
+    query = "oauth_verifier=v1&oauth_token=rk"
+
+    leader = threading.Thread(target=oauth_helpers.complete_login, args=(request_token, query))
+    leader.start()
+    assert started.wait(5)
+    try:
+        with pytest.raises(oauth_helpers.OAuthIdentityError):
+            oauth_helpers.complete_login(request_token, query)
+    finally:
+        release.set()
+        leader.join(5)
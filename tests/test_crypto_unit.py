@@ -1,5 +1,8 @@
 """Unit tests for cryptographic helpers."""
 import pytest
+from cachetools import TTLCache
+
+from src.app import crypto
 from src.app.crypto import encrypt_value, decrypt_value
 
 
@@ -13,4 +16,13 @@ def test_encrypt_decrypt_roundtrip():
 
 def test_decrypt_invalid_token_raises():
     with pytest.raises(ValueError):
-        decrypt_value(b"not-a-valid-fernet-token")
\ No newline at end of file
+        decrypt_value(b"not-a-valid-fernet-token")
+
+
+def test_decrypt_cache_skips_repeat_decrypts(monkeypatch):
+    monkeypatch.setattr(crypto, "_decrypt_cache", TTLCache(maxsize=8, ttl=60))
+    token = encrypt_value("cached secret")
+
+    assert decrypt_value(token) == "cached secret"
+    monkeypatch.setattr(crypto, "_require_fernet", lambda: pytest.fail("decrypted twice"))
+    assert decrypt_value(token) == "cached secret"
@@ -0,0 +1,58 @@
+from src.app.db import db_class
+from src.app.db.db_class import Database
+
+
+class FakeCursor:
+    description = None
+    rowcount = 1
+
+    def execute(self, sql, params=None):  # noqa: ANN001 - test helper signature
+        pass
+
+    def fetchall(self) -> list:
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.pings = 0
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor()
+
+    def ping(self, reconnect: bool = False) -> None:  # noqa: FBT002 - signature compatibility
+        self.pings += 1
+
+    def get_autocommit(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+def test_reads_ping_only_after_idle_interval(monkeypatch):
+    connection = FakeConnection()
+    monkeypatch.setattr(db_class.pymysql, "connect", lambda **kwargs: connection)
+
+    db = Database({"host": "h", "dbname": "d", "user": "u", "password": "p"})
+    db.fetch_query("SELECT status FROM tasks WHERE id = %s", ["t1"])
+    db.fetch_query("SELECT status FROM tasks WHERE id = %s", ["t1"])
+    assert connection.pings == 0
+
+    db._last_used -= Database.PING_INTERVAL
+    db.fetch_query("SELECT status FROM tasks WHERE id = %s", ["t1"])
+    assert connection.pings == 1
+
+
+def test_writes_always_ping(monkeypatch):
+    connection = FakeConnection()
+    monkeypatch.setattr(db_class.pymysql, "connect", lambda **kwargs: connection)
+
+    db = Database({"host": "h", "dbname": "d", "user": "u", "password": "p"})
+    db.fetch_query("SELECT 1")
+    db.execute_query("UPDATE tasks SET status = %s", ["Running"])
+    db.execute_query("UPDATE tasks SET status = %s", ["Running"])
+    assert connection.pings == 2
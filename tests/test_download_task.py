@@ -25,8 +25,10 @@ if "tqdm" not in sys.modules:
     sys.modules["tqdm"] = tqdm_stub
 
 from src.app.download_tasks.download import (
+    DOWNLOAD_WORKERS,
     download_commons_svgs,
     download_task,
+    fetch_file_urls,
 )
 
 
@@ -85,6 +87,23 @@ class TestDownloadCommonsSvgs:
         for title in titles:
             assert (temp_output_dir / title).exists()
 
+    @patch("src.app.download_tasks.download.requests.Session")
+    def test_download_streams_body_to_disk(self, mock_session_class, temp_output_dir):
+        """Test that the response body is written chunk by chunk without a leftover temp file."""
+        session = MagicMock()
+        response = MagicMock()
+        response.status_code = 200
+        response.iter_content.return_value = iter([b"<svg>", b"streamed", b"</svg>"])
+        session.get.return_value = response
+        mock_session_class.return_value = session
+
+        result = download_commons_svgs(["Streamed.svg"], temp_output_dir)
+
+        assert len(result) == 1
+        assert (temp_output_dir / "Streamed.svg").read_bytes() == b"<svg>streamed</svg>"
+        assert not (temp_output_dir / "Streamed.svg.part").exists()
+        assert session.get.call_args.kwargs["stream"] is True
+
     @patch("src.app.download_tasks.download.requests.Session")
     def test_download_skips_existing_files(self, mock_session_class, temp_output_dir):
         """Test that existing files are skipped."""
@@ -208,3 +227,86 @@ class TestEdgeCases:
         result = download_commons_svgs(titles, temp_output_dir)
 
         assert len(result) == 0
+
+
+class TestFetchFileUrls:
+    """Test the batched imageinfo URL lookup."""
+
+    def test_maps_normalized_and_missing_titles(self):
+        session = MagicMock()
+        response = MagicMock()
+        response.json.return_value = {
+            "query": {
+                "normalized": [{"from": "File:a_b.svg", "to": "File:A b.svg"}],
+                "pages": [
+                    {"title": "File:A b.svg", "imageinfo": [{"url": "https://upload.example/A_b.svg"}]},
+                    {"title": "File:Gone.svg", "missing": True},
+                ],
+            }
+        }
+        session.get.return_value = response
+
+        urls = fetch_file_urls(["a_b.svg", "Gone.svg"], session)
+
+        assert urls == {"a_b.svg": "https://upload.example/A_b.svg", "Gone.svg": None}
+        assert session.get.call_args.kwargs["params"]["titles"] == "File:a_b.svg|File:Gone.svg"
+
+    def test_batches_titles_and_skips_failed_batches(self):
+        import requests
+        session = MagicMock()
+        session.get.side_effect = requests.exceptions.RequestException("down")
+
+        titles = [f"F{i}.svg" for i in range(120)]
+        assert fetch_file_urls(titles, session) == {}
+        assert session.get.call_count == 3
+
+
+class TestDownloadTask:
+    """Test the download stage orchestration."""
+
+    @patch("src.app.download_tasks.download.fetch_file_urls", return_value={})
+    @patch("src.app.download_tasks.download._make_session")
+    @patch("src.app.download_tasks.download.download_one_file")
+    def test_reports_summary_once(self, mock_download_one, mock_make_session, _mock_fetch_urls, temp_output_dir):
+        mock_download_one.side_effect = lambda title, out_dir, i, session, url=None: {
+            "result": "success",
+            "path": str(out_dir / title),
+        }
+        mock_make_session.side_effect = lambda: MagicMock()
+        store = MagicMock()
+        titles = [f"File{i}.svg" for i in range(25)]
+
+        files, stages, not_done_list = download_task("task-1", {}, temp_output_dir, titles, store=store)
+
+        assert files == [str(temp_output_dir / title) for title in titles]
+        assert not_done_list == []
+        assert stages["message"] == (
+            "Total Files: 25, Downloaded 25, skip existing 0, failed to download: 0"
+        )
+        store.update_stage_column.assert_called_once_with(
+            "task-1", "download", "stage_message", stages["message"]
+        )
+        # Each worker thread uses its own session, closed once the downloads finish.
+        sessions = {id(call.args[3]): call.args[3] for call in mock_download_one.call_args_list}
+        assert len(sessions) <= DOWNLOAD_WORKERS
+        for session in sessions.values():
+            session.close.assert_called_once()
+
+    @patch("src.app.download_tasks.download.fetch_file_urls")
+    @patch("src.app.download_tasks.download._make_session")
+    def test_reports_summary_when_all_titles_are_missing(self, mock_make_session, mock_fetch_urls, temp_output_dir):
+        mock_fetch_urls.return_value = {"Gone1.svg": None, "Gone2.svg": None}
+        store = MagicMock()
+
+        files, stages, not_done_list = download_task(
+            "task-1", {}, temp_output_dir, ["Gone1.svg", "Gone2.svg"], store=store
+        )
+
+        assert files == []
+        assert not_done_list == ["Gone1.svg", "Gone2.svg"]
+        assert stages["message"] == (
+            "Total Files: 2, Downloaded 0, skip existing 0, failed to download: 2"
+        )
+        store.update_stage_column.assert_called_once_with(
+            "task-1", "download", "stage_message", stages["message"]
+        )
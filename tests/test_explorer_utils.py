@@ -0,0 +1,64 @@
+import os
+import threading
+
+from src.app.app_routes.explorer import utils
+
+
+def test_get_main_data_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "svg_data_path", tmp_path)
+    monkeypatch.setattr(utils, "_file_cache", utils.OrderedDict())
+    stats = tmp_path / "demo" / "files_stats.json"
+    stats.parent.mkdir()
+    stats.write_text('{"main_title": "a.svg"}', encoding="utf-8")
+
+    calls = []
+    real_load = utils._load_json
+    monkeypatch.setattr(utils, "_load_json", lambda path: calls.append(path) or real_load(path))
+
+    assert utils.get_main_data("demo") == {"main_title": "a.svg"}
+    assert utils.get_main_data("demo") == {"main_title": "a.svg"}
+    assert len(calls) == 1
+
+    stats.write_text('{"main_title": "bb.svg"}', encoding="utf-8")
+    os.utime(stats, ns=(0, stats.stat().st_mtime_ns + 1))
+    assert utils.get_main_data("demo") == {"main_title": "bb.svg"}
+    assert len(calls) == 2
+
+    assert utils.get_main_data("missing") == {}
+
+
+def test_get_informations_coalesces_concurrent_calls(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fake_build(title):
+        calls.append(title)
+        started.set()
+        release.wait(5)
+        return {"title": title}
+
+    waiting = threading.Event()
+
+    class TrackingFuture(utils.Future):
+        def result(self, timeout=None):
+            waiting.set()
+            return super().result(timeout)
+
+    monkeypatch.setattr(utils, "_build_informations", fake_build)
+    monkeypatch.setattr(utils, "Future", TrackingFuture)
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(utils.get_informations("demo")))
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=lambda: results.append(utils.get_informations("demo")))
+    follower.start()
+    assert waiting.wait(5)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert calls == ["demo"]
+    assert results == [{"title": "demo"}, {"title": "demo"}]
+    assert utils._inflight == {}
@@ -0,0 +1,55 @@
+"""Unit tests for the orjson JSON provider."""
+
+import datetime
+
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+from src.app.json_provider import OrjsonProvider
+
+
+def _app() -> Flask:
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    return app
+
+
+def test_jsonify_round_trips_payload():
+    app = _app()
+    with app.app_context():
+        response = jsonify({"id": "abc", "stages": {"text": {"number": 2}}, "n": [1, 2]})
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"id": "abc", "stages": {"text": {"number": 2}}, "n": [1, 2]}
+
+
+def test_dumps_handles_non_str_keys_and_falls_back_for_kwargs():
+    app = _app()
+    assert app.json.loads(app.json.dumps({1: "a"})) == {"1": "a"}
+    assert app.json.dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+
+
+def test_dates_keep_flask_http_date_format():
+    app = _app()
+    payload = {
+        "d": datetime.date(2024, 1, 2),
+        "created_at": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+    }
+    assert app.json.dumps(payload) == DefaultJSONProvider(app).dumps(payload, separators=(",", ":"))
+    assert app.json.dumps(payload) == (
+        '{"created_at":"Tue, 02 Jan 2024 03:04:05 GMT","d":"Tue, 02 Jan 2024 00:00:00 GMT"}'
+    )
+
+
+def test_sort_keys_is_honoured():
+    app = _app()
+    assert app.json.dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+    app.json.sort_keys = False
+    assert app.json.dumps({"b": 1, "a": 2}) == '{"b":1,"a":2}'
+
+
+def test_jsonify_matches_default_provider_body():
+    app = _app()
+    payload = {"status": "Running", "updated_at": datetime.datetime(2024, 5, 6, 7, 8, 9)}
+    with app.app_context():
+        body = jsonify(payload).get_data(as_text=True)
+    assert body == DefaultJSONProvider(app).dumps(payload, separators=(",", ":")) + "\n"
@@ -17,3 +17,13 @@ def test_rate_limiter_allow_and_try_after():
     # After the period passes, it's allowed again
     time.sleep(0.3)
     assert rl.allow(key) is True
+
+
+def test_rate_limiter_evicts_least_recent_key():
+    rl = RateLimiter(limit=1, period=timedelta(minutes=1), max_keys=2)
+    assert rl.allow("a") is True
+    assert rl.allow("b") is True
+    assert rl.allow("a") is False  # refreshes "a"
+    assert rl.allow("c") is True  # evicts "b"
+    assert rl.allow("b") is True
+    assert rl.allow("a") is True  # "a" was evicted by "b"
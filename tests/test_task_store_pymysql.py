@@ -313,3 +313,17 @@ def test_database_context_manager_closes_on_exit():
         assert ctx is db
 
     connection_mock.close.assert_called_once()
+
+
+def test_list_tasks_without_payloads_selects_listing_columns(store_and_db):
+    store, db = store_and_db
+    db.fetch_query_safe.return_value = [_task_row("task-1", title="Task 1", normalized_title="task 1")]
+
+    tasks = store.list_tasks(include_payloads=False)
+
+    sql = db.fetch_query_safe.call_args[0][0]
+    assert "SELECT *" not in sql
+    assert "form_json" not in sql
+    assert "data_json" not in sql
+    assert "results_json" in sql
+    assert tasks[0]["id"] == "task-1"
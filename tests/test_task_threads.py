@@ -5,9 +5,10 @@ import pytest
 
 from src.app.threads.task_threads import (
     launch_task_thread,
+    get_active_task_id,
     get_cancel_event,
 )
-from src.app.threads import web_run_task
+from src.app.threads import task_threads, web_run_task
 
 
 @pytest.mark.skip(reason="Pending rewrite")
@@ -40,6 +41,87 @@ def test_launch_thread_registers_and_cleans_cancel_event(monkeypatch):
     assert get_cancel_event(task_id) is None
 
 
+def test_active_title_tracked_while_task_runs(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+
+    def fake_run_task(_db_data, _task_id, _title, _args, _user_payload, *, cancel_event=None):
+        started.set()
+        release.wait(timeout=2)
+
+    monkeypatch.setattr(web_run_task, "run_task", fake_run_task)
+
+    launch_task_thread("t-active", "Some_Title.svg", args=SimpleNamespace(), user_payload={})
+    assert started.wait(timeout=2)
+    assert get_active_task_id("some title.svg") == "t-active"
+
+    release.set()
+    for _ in range(50):
+        if get_active_task_id("Some_Title.svg") is None:
+            break
+        time.sleep(0.02)
+    assert get_active_task_id("Some_Title.svg") is None
+
+
+def test_release_active_title_frees_title_before_runner_exits(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+
+    def fake_run_task(_db_data, _task_id, _title, _args, _user_payload, *, cancel_event=None):
+        started.set()
+        release.wait(timeout=2)
+
+    monkeypatch.setattr(web_run_task, "run_task", fake_run_task)
+
+    launch_task_thread("t-cancelled", "Cancelled.svg", args=SimpleNamespace(), user_payload={})
+    assert started.wait(timeout=2)
+
+    task_threads.release_active_title("Cancelled.svg", "t-other")
+    assert get_active_task_id("Cancelled.svg") == "t-cancelled"
+    task_threads.release_active_title("Cancelled.svg", "t-cancelled")
+    assert get_active_task_id("Cancelled.svg") is None
+
+    release.set()
+
+
+def test_launch_refuses_when_no_slot_is_free(monkeypatch):
+    release = threading.Event()
+
+    def fake_run_task(_db_data, _task_id, _title, _args, _user_payload, *, cancel_event=None):
+        release.wait(timeout=2)
+
+    monkeypatch.setattr(web_run_task, "run_task", fake_run_task)
+    monkeypatch.setattr(task_threads, "_TASK_SLOTS", threading.BoundedSemaphore(1))
+
+    assert launch_task_thread("t-first", "First", args=SimpleNamespace(), user_payload={})
+    assert not launch_task_thread("t-second", "Second", args=SimpleNamespace(), user_payload={})
+    assert get_cancel_event("t-second") is None
+
+    release.set()
+    for _ in range(50):
+        if launch_task_thread("t-third", "Third", args=SimpleNamespace(), user_payload={}):
+            break
+        time.sleep(0.02)
+    else:
+        pytest.fail("slot was not released after the first task finished")
+
+
+def test_failed_submit_releases_registrations(monkeypatch):
+    class ShutDownExecutor:
+        def submit(self, *args, **kwargs):
+            raise RuntimeError("cannot schedule new futures after shutdown")
+
+    monkeypatch.setattr(task_threads, "TASK_EXECUTOR", ShutDownExecutor())
+    monkeypatch.setattr(task_threads, "_TASK_SLOTS", threading.BoundedSemaphore(1))
+
+    with pytest.raises(RuntimeError):
+        launch_task_thread("t-shutdown", "Shutdown", args=SimpleNamespace(), user_payload={})
+
+    assert get_cancel_event("t-shutdown") is None
+    assert get_active_task_id("Shutdown") is None
+    assert task_threads._TASK_SLOTS.acquire(blocking=False)
+
+
 class SimpleNamespace:
     """Minimal args placeholder."""
     pass
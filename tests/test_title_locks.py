@@ -0,0 +1,21 @@
+"""Unit tests for the striped per-title locks."""
+
+import pytest
+
+from src.app.threads.title_locks import StripedLock, title_lock
+
+
+def test_same_normalized_title_shares_lock():
+    assert title_lock("Example_File.svg") is title_lock("  example file.svg ")
+
+
+def test_striped_lock_returns_one_of_its_shards():
+    locks = StripedLock(shards=4)
+    assert locks.for_key("a") in locks._locks
+    assert locks.for_key("a") is locks.for_key("a")
+
+
+@pytest.mark.parametrize("shards", [0, 3, 12])
+def test_striped_lock_rejects_non_power_of_two(shards):
+    with pytest.raises(ValueError):
+        StripedLock(shards=shards)
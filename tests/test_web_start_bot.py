@@ -48,3 +48,17 @@ def test_translations_task_stops_on_failure(
     assert translations == {}
     assert updated_stages["status"] == "Failed"
     assert updated_stages["message"] == expected_message
+
+
+def test_titles_task_drops_duplicate_titles(monkeypatch):
+    monkeypatch.setattr(
+        start_bot,
+        "get_files",
+        lambda text: ("Main.svg", ["A.svg", "B.svg", "A.svg", "C.svg", "B.svg"]),
+    )
+    stages = {"status": None, "message": None, "sub_name": None}
+
+    data, updated_stages = start_bot.titles_task(stages, "text", None, titles_limit=2)
+
+    assert data["titles"] == ["A.svg", "B.svg"]
+    assert updated_stages["message"] == "Found 3 titles, use only 2"